@@ -0,0 +1,44 @@
+"""add description trigram index
+
+Revision ID: 4a1f0c2d9e7b
+Revises: ef7c363526f9
+Create Date: 2026-01-12 10:42:17.381904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a1f0c2d9e7b'
+down_revision: Union[str, None] = 'ef7c363526f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram index so the description arm of search (%> operator) avoids a seqscan.
+    # It is partial, so that arm must keep its "description IS NOT NULL" predicate.
+    # videos.title is already covered by idx_videos_title_trgm.
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'videos_description_trgm_idx',
+            'videos',
+            ['description'],
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+            postgresql_where=sa.text('description IS NOT NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'videos_description_trgm_idx',
+            table_name='videos',
+            postgresql_concurrently=True
+        )
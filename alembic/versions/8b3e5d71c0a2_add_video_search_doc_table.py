@@ -0,0 +1,110 @@
+"""add video_search_doc table
+
+Revision ID: 8b3e5d71c0a2
+Revises: 4a1f0c2d9e7b
+Create Date: 2026-01-14 16:08:52.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b3e5d71c0a2'
+down_revision: Union[str, None] = '4a1f0c2d9e7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One pre-weighted search document per video:
+    # title = A, description = B, transcript = C
+    op.create_table(
+        'video_search_doc',
+        sa.Column('video_id', sa.Integer(), nullable=False),
+        sa.Column('doc', sa.dialects.postgresql.TSVECTOR(), nullable=False),
+        sa.ForeignKeyConstraint(['video_id'], ['videos.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('video_id')
+    )
+
+    op.create_index('idx_video_search_doc', 'video_search_doc', ['doc'],
+                    postgresql_using='gin')
+
+    # Rebuild a video's document from the tsvector columns the existing
+    # triggers already maintain, so no text is re-parsed here
+    op.execute("""
+        CREATE FUNCTION refresh_video_search_doc(p_video_id integer) RETURNS void AS $$
+        BEGIN
+            INSERT INTO video_search_doc (video_id, doc)
+            SELECT
+                v.id,
+                setweight(COALESCE(v.title_search_vector, ''::tsvector), 'A')
+                    || setweight(COALESCE(v.description_search_vector, ''::tsvector), 'B')
+                    || setweight(COALESCE(t.text_search_vector, ''::tsvector), 'C')
+            FROM videos v
+            LEFT JOIN transcripts t ON t.video_id = v.id
+            WHERE v.id = p_video_id
+            ON CONFLICT (video_id) DO UPDATE SET doc = EXCLUDED.doc;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE FUNCTION video_search_doc_from_videos() RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_video_search_doc(NEW.id);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE FUNCTION video_search_doc_from_transcripts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM refresh_video_search_doc(OLD.video_id);
+            ELSE
+                PERFORM refresh_video_search_doc(NEW.video_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # AFTER triggers run once the BEFORE tsvector triggers have filled the vectors
+    op.execute("""
+        CREATE TRIGGER videos_search_doc_update
+        AFTER INSERT OR UPDATE OF title, description ON videos
+        FOR EACH ROW EXECUTE FUNCTION video_search_doc_from_videos()
+    """)
+
+    op.execute("""
+        CREATE TRIGGER transcripts_search_doc_update
+        AFTER INSERT OR UPDATE OF text OR DELETE ON transcripts
+        FOR EACH ROW EXECUTE FUNCTION video_search_doc_from_transcripts()
+    """)
+
+    # Backfill existing videos
+    op.execute("""
+        INSERT INTO video_search_doc (video_id, doc)
+        SELECT
+            v.id,
+            setweight(COALESCE(v.title_search_vector, ''::tsvector), 'A')
+                || setweight(COALESCE(v.description_search_vector, ''::tsvector), 'B')
+                || setweight(COALESCE(t.text_search_vector, ''::tsvector), 'C')
+        FROM videos v
+        LEFT JOIN transcripts t ON t.video_id = v.id
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS transcripts_search_doc_update ON transcripts')
+    op.execute('DROP TRIGGER IF EXISTS videos_search_doc_update ON videos')
+    op.execute('DROP FUNCTION IF EXISTS video_search_doc_from_transcripts()')
+    op.execute('DROP FUNCTION IF EXISTS video_search_doc_from_videos()')
+    op.execute('DROP FUNCTION IF EXISTS refresh_video_search_doc(integer)')
+
+    op.drop_index('idx_video_search_doc', table_name='video_search_doc')
+    op.drop_table('video_search_doc')
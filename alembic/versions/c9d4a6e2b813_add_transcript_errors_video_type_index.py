@@ -0,0 +1,39 @@
+"""add transcript_errors video/type index
+
+Revision ID: c9d4a6e2b813
+Revises: 8b3e5d71c0a2
+Create Date: 2026-01-19 11:23:40.518276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d4a6e2b813'
+down_revision: Union[str, None] = '8b3e5d71c0a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Supports the retry/fetch-missing joins on transcript_errors.
+    # transcripts.video_id is already covered by its unique constraint.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transcript_errors_video_type',
+            'transcript_errors',
+            ['video_id', 'error_type'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transcript_errors_video_type',
+            table_name='transcript_errors',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,41 @@
+"""add videos channel/video index
+
+Revision ID: e17b2f4a9c05
+Revises: c9d4a6e2b813
+Create Date: 2026-01-19 14:02:11.730954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e17b2f4a9c05'
+down_revision: Union[str, None] = 'c9d4a6e2b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets per-channel video lookups be answered from the index alone.
+    # transcripts.video_id is already covered by its unique constraint and
+    # transcript_errors (video_id, error_type) was added in c9d4a6e2b813.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_videos_channel_video',
+            'videos',
+            ['channel_id', 'video_id'],
+            unique=True,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_videos_channel_video',
+            table_name='videos',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,50 @@
+"""add websub lookup indexes
+
+Revision ID: f2a8c6d13e47
+Revises: e17b2f4a9c05
+Create Date: 2026-01-20 09:41:27.164302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c6d13e47'
+down_revision: Union[str, None] = 'e17b2f4a9c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Hub verification looks up (topic_url, verify_token); renewal filters
+    # on status = 'active' AND expires_at <= threshold.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_websub_topic_token',
+            'websub_subscriptions',
+            ['topic_url', 'verify_token'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_websub_status_expires',
+            'websub_subscriptions',
+            ['status', 'expires_at'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_websub_status_expires',
+            table_name='websub_subscriptions',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_websub_topic_token',
+            table_name='websub_subscriptions',
+            postgresql_concurrently=True
+        )
@@ -1,12 +1,13 @@
 from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect, BackgroundTasks, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from backend.database import SessionLocal
 from backend.search import SearchService
 from backend.models import Channel, Video, Transcript, TranscriptError
 from backend.services.channel_service import ChannelService
-from backend.youtube_client import YouTubeClient
+from backend.youtube_client import YouTubeClient, parse_published_at
 from sqlalchemy import func
 from typing import Optional, Dict
 import logging
@@ -524,27 +525,31 @@ async def search_channel(
     channel_id: str,
     q: str = Query(..., description="Search query"),
     limit: int = Query(20, ge=1, le=200, description="Results per page"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    after_rank: Optional[float] = Query(None, description="Cursor: rank of the last result on the previous page"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last result on the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Search within a specific channel's transcripts with pagination"""
+    """Search within a specific channel's transcripts with keyset pagination"""
     try:
         search_service = SearchService(db)
-        results, total_count = search_service.search_channel(
+        results, has_more, next_cursor = search_service.search_channel(
             channel_id=channel_id,
             query=q,
             limit=limit,
-            offset=offset
+            after_rank=after_rank,
+            after_id=after_id
         )
 
         return {
             "query": q,
             "channel_id": channel_id,
             "count": len(results),
-            "total": total_count,
-            "offset": offset,
             "limit": limit,
-            "has_more": offset + len(results) < total_count,
+            "has_more": has_more,
+            "next_cursor": {
+                "after_rank": next_cursor[0],
+                "after_id": next_cursor[1]
+            } if next_cursor else None,
             "results": results
         }
     except Exception as e:
@@ -706,7 +711,7 @@ async def submit_video_transcript(
                 channel_id=channel.id,
                 title=video_data['title'],
                 description=video_data.get('description', ''),
-                published_at=datetime.fromisoformat(video_data['publishedAt'].replace('Z', '+00:00')),
+                published_at=parse_published_at(video_data['publishedAt']),
                 thumbnail_url=video_data.get('thumbnailUrl', '')
             )
             db.add(video)
@@ -843,9 +848,10 @@ async def receive_webhook(request: Request, db: Session = Depends(get_db)):
         # Get signature from headers
         signature = request.headers.get('X-Hub-Signature')
 
-        # Process the notification
+        # Process the notification off the event loop; it blocks on the YouTube
+        # API and on the notification writer's commit
         websub_service = WebSubService(db)
-        result = websub_service.process_notification(body, signature)
+        result = await run_in_threadpool(websub_service.process_notification, body, signature)
 
         if result['success']:
             logger.info(f"WebSub notification processed: {result['message']}")
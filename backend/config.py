@@ -41,6 +41,9 @@ if not WEBSUB_CALLBACK_URL:
 if not WEBSUB_SECRET:
     raise ValueError("WEBSUB_SECRET not found in .env file")
 
+# Encoded once for HMAC verification of hub notifications
+WEBSUB_SECRET_BYTES = WEBSUB_SECRET.encode('utf-8')
+
 if not CHROME_EXTENSION_ID:
     raise ValueError("CHROME_EXTENSION_ID not found in .env file")
 
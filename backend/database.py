@@ -3,7 +3,8 @@ from sqlalchemy.orm import sessionmaker
 from backend.config import DATABASE_URL
 from backend.models import Base
 
-engine = create_engine(DATABASE_URL)
+# Room for every statement shape the app compiles, so none get evicted and recompiled
+engine = create_engine(DATABASE_URL, query_cache_size=1200)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
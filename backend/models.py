@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import TSVECTOR, JSONB
@@ -41,6 +41,10 @@ class Video(Base):
     transcript = relationship('Transcript', back_populates='video', uselist=False, cascade='all, delete-orphan')
     transcript_errors = relationship('TranscriptError', back_populates='video', cascade='all, delete-orphan')
 
+    __table_args__ = (
+        Index('ix_videos_channel_video', 'channel_id', 'video_id', unique=True),
+    )
+
 class Transcript(Base):
     __tablename__ = 'transcripts'
 
@@ -57,6 +61,13 @@ class Transcript(Base):
 
     video = relationship('Video', back_populates='transcript')
 
+class VideoSearchDoc(Base):
+    """Per-video weighted search document, maintained by database triggers"""
+    __tablename__ = 'video_search_doc'
+
+    video_id = Column(Integer, ForeignKey('videos.id', ondelete='CASCADE'), primary_key=True)
+    doc = Column(TSVECTOR, nullable=False)
+
 class TranscriptError(Base):
     __tablename__ = 'transcript_errors'
 
@@ -68,6 +79,10 @@ class TranscriptError(Base):
 
     video = relationship('Video', back_populates='transcript_errors')
 
+    __table_args__ = (
+        Index('ix_transcript_errors_video_type', 'video_id', 'error_type'),
+    )
+
 class WebSubSubscription(Base):
     __tablename__ = 'websub_subscriptions'
 
@@ -87,4 +102,9 @@ class WebSubSubscription(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship
-    channel = relationship('Channel', backref='websub_subscription')
\ No newline at end of file
+    channel = relationship('Channel', backref='websub_subscription')
+
+    __table_args__ = (
+        Index('ix_websub_topic_token', 'topic_url', 'verify_token'),
+        Index('ix_websub_status_expires', 'status', 'expires_at'),
+    )
\ No newline at end of file
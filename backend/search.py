@@ -1,6 +1,6 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from typing import List, Dict, Optional
 import re
 
 class SearchService:
@@ -17,10 +17,15 @@ class SearchService:
         """
         Optimized search that returns match counts and best snippet per video.
 
+        Candidates come from a ranked lookup against video_search_doc (one
+        weighted document per video), plus the substring and fuzzy arms that
+        stemming misses: transcript ILIKE, title % and description %>, each
+        served by a trigram index. min_similarity is the trigram threshold.
+
         Returns:
             List of videos with: {
                 video_id, title, channel_name, thumbnail_url, published_at,
-                transcript_matches: int,
+                transcript_matches: int (occurrences of the query in the transcript),
                 title_matches: int,
                 description_matches: int,
                 best_snippet: str,
@@ -30,113 +35,102 @@ class SearchService:
         """
         ts_query = self._prepare_tsquery(query, exact_match)
 
-        # Single optimized query using UNION ALL and aggregation
+        # The trigram operators (%, %>) can use the gin_trgm_ops indexes, unlike
+        # similarity() > x. Their thresholds are settings, so scope them to this transaction.
+        self.db.execute(
+            text("""
+                SELECT set_config('pg_trgm.similarity_threshold', :min_similarity, true),
+                       set_config('pg_trgm.word_similarity_threshold', :min_similarity, true)
+            """),
+            {'min_similarity': str(min_similarity)}
+        )
+
+        # Weights are {D, C, B, A}: transcript (C) > title (A) > description (B),
+        # matching the old per-arm multipliers scaled by 1/10. Arm scores are summed
+        # per video, so an exact substring match in the transcript keeps its boost
+        # (+100 on the old scale) on top of its text rank. Snippets are only built
+        # for the top rows.
         sql = text("""
-            WITH search_results AS (
-                -- Transcript matches
-                SELECT
-                    v.id as video_id,
-                    v.video_id as video_yt_id,
-                    v.title,
-                    v.thumbnail_url,
-                    v.published_at,
-                    c.channel_name,
-                    'transcript' as match_type,
-                    ts_rank(t.text_search_vector, to_tsquery('english', :ts_query)) * 10
-                        + similarity(t.text, :original_query) * 5
-                        + CASE WHEN t.text ILIKE :like_query THEN 100 ELSE 0 END as rank,
-                    ts_headline('english', t.text, to_tsquery('english', :ts_query),
-                        'StartSel=<<, StopSel=>>, MaxWords=50, MinWords=25') as snippet,
-                    (
-                        SELECT (s->>'start')::float
-                        FROM jsonb_array_elements(t.snippets) as s
-                        WHERE lower(s->>'text') LIKE :like_query_lower
-                        LIMIT 1
-                    ) as timestamp
-                FROM videos v
-                JOIN transcripts t ON v.id = t.video_id
-                JOIN channels c ON v.channel_id = c.id
-                WHERE
-                    t.text_search_vector @@ to_tsquery('english', :ts_query)
-                    OR similarity(t.text, :original_query) > :min_similarity
-                    OR t.text ILIKE :like_query
+            WITH q AS (
+                SELECT to_tsquery('english', :ts_query) AS tq
+            ),
+            candidates AS (
+                SELECT d.video_id, ts_rank('{0.1, 1.0, 0.2, 0.5}', d.doc, q.tq) AS rank
+                FROM video_search_doc d, q
+                WHERE d.doc @@ q.tq
 
                 UNION ALL
 
-                -- Title matches
-                SELECT
-                    v.id,
-                    v.video_id,
-                    v.title,
-                    v.thumbnail_url,
-                    v.published_at,
-                    c.channel_name,
-                    'title',
-                    ts_rank(v.title_search_vector, to_tsquery('english', :ts_query)) * 5
-                        + similarity(v.title, :original_query) * 3 as rank,
-                    v.title as snippet,
-                    NULL as timestamp
+                SELECT t.video_id, 10 AS rank
+                FROM transcripts t
+                WHERE t.text ILIKE :like_query
+
+                UNION ALL
+
+                SELECT v.id, similarity(v.title, :original_query) * 0.3 AS rank
                 FROM videos v
-                JOIN channels c ON v.channel_id = c.id
-                WHERE
-                    v.title_search_vector @@ to_tsquery('english', :ts_query)
-                    OR similarity(v.title, :original_query) > :min_similarity
+                WHERE v.title % :original_query
 
                 UNION ALL
 
-                -- Description matches
-                SELECT
-                    v.id,
-                    v.video_id,
-                    v.title,
-                    v.thumbnail_url,
-                    v.published_at,
-                    c.channel_name,
-                    'description',
-                    ts_rank(v.description_search_vector, to_tsquery('english', :ts_query)) * 2
-                        + similarity(v.description, :original_query) * 1 as rank,
-                    ts_headline('english', v.description, to_tsquery('english', :ts_query),
-                        'StartSel=<<, StopSel=>>, MaxWords=30, MinWords=15') as snippet,
-                    NULL as timestamp
+                SELECT v.id, word_similarity(:original_query, v.description) * 0.1 AS rank
                 FROM videos v
-                JOIN channels c ON v.channel_id = c.id
-                WHERE
-                    v.description IS NOT NULL
-                    AND (
-                        v.description_search_vector @@ to_tsquery('english', :ts_query)
-                        OR similarity(v.description, :original_query) > :min_similarity
-                    )
+                WHERE v.description IS NOT NULL
+                  AND v.description %> :original_query
+            ),
+            top AS (
+                SELECT video_id, SUM(rank) AS rank
+                FROM candidates
+                GROUP BY video_id
+                ORDER BY rank DESC
+                LIMIT :limit
+            ),
+            matched AS (
+                SELECT
+                    top.video_id,
+                    top.rank,
+                    t.text,
+                    t.snippets,
+                    GREATEST(
+                        COALESCE((LENGTH(LOWER(t.text)) - LENGTH(REPLACE(LOWER(t.text), LOWER(:original_query), '')))
+                            / NULLIF(LENGTH(:original_query), 0), 0),
+                        COALESCE((ts_filter(d.doc, '{c}') @@ q.tq)::int, 0)
+                    ) AS transcript_matches,
+                    (COALESCE(ts_filter(d.doc, '{a}') @@ q.tq, false)
+                        OR v.title % :original_query)::int AS title_matches,
+                    (COALESCE(ts_filter(d.doc, '{b}') @@ q.tq, false)
+                        OR COALESCE(v.description %> :original_query, false))::int AS description_matches
+                FROM top
+                CROSS JOIN q
+                JOIN videos v ON v.id = top.video_id
+                LEFT JOIN video_search_doc d ON d.video_id = top.video_id
+                LEFT JOIN transcripts t ON t.video_id = top.video_id
             )
             SELECT
-                video_yt_id,
-                title,
-                channel_name,
-                thumbnail_url,
-                published_at,
-                COUNT(*) FILTER (WHERE match_type = 'transcript') as transcript_matches,
-                COUNT(*) FILTER (WHERE match_type = 'title') as title_matches,
-                COUNT(*) FILTER (WHERE match_type = 'description') as description_matches,
-                MAX(rank) as max_rank,
-                (
-                    SELECT snippet
-                    FROM search_results sr2
-                    WHERE sr2.video_id = search_results.video_id
-                        AND sr2.match_type = 'transcript'
-                    ORDER BY sr2.rank DESC
-                    LIMIT 1
-                ) as best_snippet,
-                (
-                    SELECT timestamp
-                    FROM search_results sr2
-                    WHERE sr2.video_id = search_results.video_id
-                        AND sr2.match_type = 'transcript'
-                    ORDER BY sr2.rank DESC
+                v.video_id,
+                v.title,
+                c.channel_name,
+                v.thumbnail_url,
+                v.published_at,
+                m.transcript_matches,
+                m.title_matches,
+                m.description_matches,
+                m.rank,
+                CASE WHEN m.transcript_matches > 0 THEN
+                    ts_headline('english', m.text, q.tq,
+                        'StartSel=<<, StopSel=>>, MaxWords=50, MinWords=25')
+                END as best_snippet,
+                CASE WHEN m.transcript_matches > 0 THEN (
+                    SELECT (s->>'start')::float
+                    FROM jsonb_array_elements(m.snippets) as s
+                    WHERE lower(s->>'text') LIKE :like_query_lower
                     LIMIT 1
-                ) as best_timestamp
-            FROM search_results
-            GROUP BY video_id, video_yt_id, title, channel_name, thumbnail_url, published_at
-            ORDER BY max_rank DESC
-            LIMIT :limit
+                ) END as best_timestamp
+            FROM matched m
+            CROSS JOIN q
+            JOIN videos v ON v.id = m.video_id
+            JOIN channels c ON v.channel_id = c.id
+            ORDER BY m.rank DESC
         """)
 
         results = self.db.execute(sql, {
@@ -144,7 +138,6 @@ class SearchService:
             'original_query': query,
             'like_query': f'%{query}%',
             'like_query_lower': f'%{query.lower()}%',
-            'min_similarity': min_similarity,
             'limit': limit
         }).fetchall()
 
@@ -186,57 +179,25 @@ class SearchService:
         channel_id: str,
         query: str,
         limit: int = 20,
-        offset: int = 0,
+        after_rank: Optional[float] = None,
+        after_id: Optional[int] = None,
         exact_match: bool = False,
         min_similarity: float = 0.3
-    ) -> tuple[List[Dict], int]:
-        """Optimized search within a specific channel with pagination. Returns (results, total_count)."""
-        ts_query = self._prepare_tsquery(query, exact_match)
-
-        # First, get total count
-        count_sql = text("""
-            WITH search_results AS (
-                SELECT DISTINCT v.id as video_id
-                FROM videos v
-                JOIN transcripts t ON v.id = t.video_id
-                JOIN channels c ON v.channel_id = c.id
-                WHERE
-                    c.channel_id = :channel_id
-                    AND (
-                        t.text_search_vector @@ to_tsquery('english', :ts_query)
-                        OR t.text ILIKE :like_query
-                    )
-
-                UNION
-
-                SELECT DISTINCT v.id
-                FROM videos v
-                JOIN channels c ON v.channel_id = c.id
-                WHERE
-                    c.channel_id = :channel_id
-                    AND v.title_search_vector @@ to_tsquery('english', :ts_query)
+    ) -> tuple[List[Dict], bool, Optional[tuple[float, int]]]:
+        """
+        Optimized search within a specific channel with keyset pagination.
 
-                UNION
+        Pass the previous page's cursor as (after_rank, after_id) to continue.
+        Returns (results, has_next, next_cursor).
+        """
+        ts_query = self._prepare_tsquery(query, exact_match)
 
-                SELECT DISTINCT v.id
-                FROM videos v
-                JOIN channels c ON v.channel_id = c.id
-                WHERE
-                    c.channel_id = :channel_id
-                    AND v.description IS NOT NULL
-                    AND v.description_search_vector @@ to_tsquery('english', :ts_query)
-            )
-            SELECT COUNT(DISTINCT video_id) FROM search_results
-        """)
+        # Keyset cursor on (max_rank DESC, video_pk DESC) - no COUNT(*) needed
+        keyset_filter = ""
+        if after_rank is not None and after_id is not None:
+            keyset_filter = "WHERE (max_rank, video_pk) < (:after_rank, :after_id)"
 
-        total_count = self.db.execute(count_sql, {
-            'channel_id': channel_id,
-            'ts_query': ts_query,
-            'like_query': f'%{query}%'
-        }).scalar()
-
-        # Then get the paginated results
-        sql = text("""
+        sql = text(f"""
             WITH search_results AS (
                 SELECT
                     v.id as video_id,
@@ -295,33 +256,44 @@ class SearchService:
                     c.channel_id = :channel_id
                     AND v.description IS NOT NULL
                     AND v.description_search_vector @@ to_tsquery('english', :ts_query)
+            ),
+            ranked AS (
+                SELECT
+                    video_yt_id,
+                    title,
+                    channel_name,
+                    thumbnail_url,
+                    published_at,
+                    MAX(transcript_match_count)::int as transcript_matches,
+                    COUNT(*) FILTER (WHERE match_type = 'title') as title_matches,
+                    COUNT(*) FILTER (WHERE match_type = 'description') as description_matches,
+                    -- float8 so the cursor value round-trips exactly through Python
+                    MAX(rank)::double precision as max_rank,
+                    video_id as video_pk
+                FROM search_results
+                GROUP BY video_id, video_yt_id, title, channel_name, thumbnail_url, published_at
             )
-            SELECT
-                video_yt_id,
-                title,
-                channel_name,
-                thumbnail_url,
-                published_at,
-                MAX(transcript_match_count)::int as transcript_matches,
-                COUNT(*) FILTER (WHERE match_type = 'title') as title_matches,
-                COUNT(*) FILTER (WHERE match_type = 'description') as description_matches,
-                MAX(rank) as max_rank
-            FROM search_results
-            GROUP BY video_id, video_yt_id, title, channel_name, thumbnail_url, published_at
-            ORDER BY max_rank DESC
+            SELECT *
+            FROM ranked
+            {keyset_filter}
+            ORDER BY max_rank DESC, video_pk DESC
             LIMIT :limit
-            OFFSET :offset
         """)
 
+        # Fetch one extra row to know whether a next page exists
         results = self.db.execute(sql, {
             'channel_id': channel_id,
             'ts_query': ts_query,
             'query': query,  # Add the raw query for counting
             'like_query': f'%{query}%',
-            'limit': limit,
-            'offset': offset
+            'after_rank': after_rank,
+            'after_id': after_id,
+            'limit': limit + 1
         }).fetchall()
 
+        has_next = len(results) > limit
+        results = results[:limit]
+
         result_list = [
             {
                 'video_id': row[0],
@@ -337,7 +309,12 @@ class SearchService:
             for row in results
         ]
 
-        return result_list, total_count
+        next_cursor = None
+        if has_next:
+            last = results[-1]
+            next_cursor = (float(last[8]), last[9])
+
+        return result_list, has_next, next_cursor
 
     def get_batch_snippets(self, video_ids: List[str], query: str) -> Dict[str, Dict]:
         """
@@ -352,18 +329,8 @@ class SearchService:
         sql = text("""
             SELECT
                 v.video_id,
-                CASE
-                    WHEN position(lower(:query) in lower(t.text)) > 0 THEN
-                        CASE WHEN position(lower(:query) in lower(t.text)) > 75 THEN '...' ELSE '' END ||
-                        SUBSTRING(
-                            t.text,
-                            GREATEST(1, position(lower(:query) in lower(t.text)) - 75),
-                            150 + LENGTH(:query)
-                        ) ||
-                        CASE WHEN position(lower(:query) in lower(t.text)) + LENGTH(:query) + 75 < LENGTH(t.text) THEN '...' ELSE '' END
-                    ELSE
-                        SUBSTRING(t.text, 1, 200) || '...'
-                END as snippet,
+                ts_headline('english', t.text, to_tsquery('english', :ts_query),
+                    'StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=15') as snippet,
                 (
                     SELECT (elem->>'start')::float
                     FROM jsonb_array_elements(t.snippets) elem
@@ -388,24 +355,11 @@ class SearchService:
             'query': query
         }).fetchall()
 
-        # Build dict with manual highlighting
-        import re
+        # ts_headline already wraps matches in <mark> tags
         snippets = {}
         for row in results:
-            raw_snippet = row[1]
-            # Add <mark> tags around the query in the snippet (case-insensitive)
-            if raw_snippet and query:
-                highlighted = re.sub(
-                    f'({re.escape(query)})',
-                    r'<mark>\1</mark>',
-                    raw_snippet,
-                    flags=re.IGNORECASE
-                )
-            else:
-                highlighted = raw_snippet
-
             snippets[row[0]] = {
-                'snippet': highlighted,
+                'snippet': row[1],
                 'timestamp': float(row[2]) if row[2] else None
             }
 
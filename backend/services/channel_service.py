@@ -1,11 +1,167 @@
+import logging
+import queue
+import threading
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from backend.models import Channel, Video, Transcript, TranscriptError
-from backend.youtube_client import YouTubeClient
+from backend.youtube_client import YouTubeClient, parse_published_at
 from backend.transcript_fetcher import TranscriptFetcher, IpBlockedException
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Iterator, List, Tuple
 from backend.services.websub_service import WebSubService
 
+# Number of transcript/error rows to write per transaction
+COMMIT_BATCH = 200
+
+# Concurrent transcript requests to YouTube
+FETCH_WORKERS = 8
+
+# Fetched results buffered for the writer thread before fetching blocks
+WRITE_QUEUE_SIZE = 64
+
+# Seconds the writer waits before flushing a partial batch
+WRITE_FLUSH_INTERVAL = 2.0
+
+logger = logging.getLogger(__name__)
+
+
+class _TranscriptWriter:
+    """
+    Persist fetched transcripts and errors from a background thread with its
+    own Session, so the fetch loop never waits on database commits.
+    Transcripts are reported through emit (from the writer thread) and
+    counted in saved only once committed.
+    """
+
+    def __init__(self, bind, emit: Callable, clear_errors: bool = False):
+        self.clear_errors = clear_errors
+        self.saved = 0
+        self._emit = emit
+        self._queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._session = Session(bind=bind)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='transcript-writer', daemon=True)
+        self._thread.start()
+
+    def put(self, video_pk: int, transcript_data: Optional[Dict], error_data: Optional[Dict]):
+        """Queue one fetch result for writing"""
+        if transcript_data or error_data:
+            self._queue.put((video_pk, transcript_data, error_data))
+
+    def close(self, reraise: bool = True):
+        """
+        Flush everything queued and stop the thread. A writer failure is
+        re-raised, or only logged when reraise is False (used while another
+        exception is already propagating, so it isn't masked).
+        """
+        self._queue.put(None)
+        self._thread.join()
+        self._session.close()
+        if self._error is not None:
+            if reraise:
+                raise self._error
+            logger.error('Transcript writer failed: %s', self._error)
+
+    def _run(self):
+        try:
+            self._drain()
+        except BaseException as e:
+            self._error = e
+            # Keep consuming so producers never block on a full queue, unless
+            # the sentinel was already taken (the final flush failed)
+            if not self._closed:
+                while self._queue.get() is not None:
+                    pass
+
+    def _drain(self):
+        batch = []
+        deadline = time.monotonic() + WRITE_FLUSH_INTERVAL
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                self._closed = True
+                break
+            if item:
+                batch.append(item)
+
+            now = time.monotonic()
+            if len(batch) >= COMMIT_BATCH or now >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = now + WRITE_FLUSH_INTERVAL
+
+        self._flush(batch)
+
+    def _flush(self, batch: list):
+        """
+        Write a batch in one transaction. If the batch fails, its savepoint is
+        rolled back and the rows are retried under one savepoint each, so a
+        bad row is skipped without losing the rest of the batch.
+        """
+        if not batch:
+            return
+
+        written = batch
+        try:
+            with self._session.begin_nested():
+                self._write(batch)
+        except Exception:
+            written = []
+            for item in batch:
+                try:
+                    with self._session.begin_nested():
+                        self._write([item])
+                    written.append(item)
+                except Exception as e:
+                    logger.warning('Failed to save row for video %s: %s', item[0], e)
+                    self._emit('video_status', {'status': 'error', 'error_type': 'SaveFailed'})
+
+        self._session.commit()
+
+        for _, transcript_data, _ in written:
+            if transcript_data:
+                self.saved += 1
+                self._emit('video_status', {
+                    'status': 'transcript_saved',
+                    'length': len(transcript_data['text'])
+                })
+
+    def _write(self, batch: list):
+        transcripts = []
+        errors = []
+        for video_pk, transcript_data, error_data in batch:
+            if transcript_data:
+                transcripts.append({
+                    'video_id': video_pk,
+                    'text': transcript_data['text'],
+                    'snippets': transcript_data['snippets'],
+                    'language_code': transcript_data['language_code'],
+                    'is_generated': transcript_data['is_generated']
+                })
+            elif error_data:
+                errors.append({
+                    'video_id': video_pk,
+                    'error_type': error_data['error_type'],
+                    'error_message': error_data['error_message']
+                })
+
+        if transcripts:
+            self._session.bulk_insert_mappings(Transcript, transcripts)
+            if self.clear_errors:
+                # Delete previous errors for the whole batch in one statement
+                self._session.query(TranscriptError).filter(
+                    TranscriptError.video_id.in_([row['video_id'] for row in transcripts])
+                ).delete(synchronize_session=False)
+        if errors:
+            self._session.bulk_insert_mappings(TranscriptError, errors)
+
 class ChannelService:
     def __init__(self, db: Session, progress_callback: Optional[Callable] = None):
         self.db = db
@@ -21,6 +177,117 @@ class ChannelService:
         """Emit a progress event"""
         self.progress_callback(event, data)
 
+    def _insert_new_videos(self, channel_pk: int, videos: List[Dict], video_pks: Dict[str, int]) -> int:
+        """
+        Insert the videos that don't exist yet in one statement and commit.
+        video_pks (video_id -> primary key) is updated in place, for existing
+        videos from one lookup and for new ones from RETURNING, so callers
+        never re-query for the keys. Returns the number inserted.
+        """
+        # video_id is unique across all channels, so existence is checked globally
+        unknown_ids = [v['video_id'] for v in videos if v['video_id'] not in video_pks]
+        if unknown_ids:
+            video_pks.update(
+                self.db.query(Video.video_id, Video.id).filter(Video.video_id.in_(unknown_ids))
+            )
+
+        new_rows = {}
+        for v in videos:
+            if v['video_id'] not in video_pks:
+                new_rows.setdefault(v['video_id'], {
+                    'channel_id': channel_pk,
+                    'video_id': v['video_id'],
+                    'title': v['title'],
+                    'description': v['description'],
+                    'published_at': parse_published_at(v['published_at']),
+                    'thumbnail_url': v['thumbnail_url']
+                })
+        new_rows = list(new_rows.values())
+        if new_rows:
+            stmt = pg_insert(Video).values(new_rows).returning(Video.video_id, Video.id)
+            video_pks.update(self.db.execute(stmt).tuples())
+            self.db.commit()
+
+        return len(new_rows)
+
+    def _fetch_transcripts(self, videos: List[Tuple[int, str, str]],
+                           concurrency: int = FETCH_WORKERS) -> Iterator[Tuple[Tuple[int, str, str], Optional[Dict], Optional[Dict]]]:
+        """
+        Fetch transcripts for (video_pk, video_id, title) tuples with up to
+        concurrency requests in flight.
+
+        Yields (video, transcript_data, error_data) as fetches complete. Plain
+        tuples are used so commits don't expire anything the caller reads, and
+        database writes stay with the caller since the Session is not thread-safe.
+
+        Raises:
+            IpBlockedException: After cancelling the fetches that haven't started
+                and waiting for the in-flight ones to finish
+        """
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = {
+                executor.submit(self.transcript_fetcher.fetch_transcript, video[1]): video
+                for video in videos
+            }
+            for future in as_completed(futures):
+                transcript_data, error_data = future.result()
+                yield futures[future], transcript_data, error_data
+        finally:
+            # Wait out in-flight fetches so none keep hitting YouTube after an IP block
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_and_persist_transcripts(self, videos: List[Tuple[int, str, str]], clear_errors: bool = False,
+                                       concurrency: int = FETCH_WORKERS) -> Tuple[int, bool, int]:
+        """
+        Fetch and store transcripts for (video_pk, video_id, title) tuples,
+        emitting progress as results arrive. Stops on an IP block after
+        persisting what was already fetched.
+        Returns (transcripts_committed, stopped_early, last_idx).
+        """
+        stopped_early = False
+
+        # Throttle video_progress to ~100 events per run
+        emit = self._emit
+        total = len(videos)
+        progress_step = max(1, total // 100)
+        writer = _TranscriptWriter(self.db.get_bind(), emit, clear_errors=clear_errors)
+        idx = 0
+        try:
+            for idx, ((video_pk, video_id, title), transcript_data, error_data) in enumerate(
+                self._fetch_transcripts(videos, concurrency), 1
+            ):
+                if idx == 1 or idx % progress_step == 0 or idx == total:
+                    emit('video_progress', {
+                        'current': idx,
+                        'total': total,
+                        'video_id': video_id,
+                        'title': title
+                    })
+
+                # The writer reports saved transcripts once they are committed
+                writer.put(video_pk, transcript_data, error_data)
+
+                if error_data:
+                    emit('video_status', {
+                        'status': 'error',
+                        'error_type': error_data['error_type']
+                    })
+        except IpBlockedException:
+            emit('error', {
+                'message': f'IP blocked after processing {idx} videos. Stopping transcript fetching.'
+            })
+            stopped_early = True
+        except BaseException:
+            # Persist what was fetched without masking the error in flight
+            writer.close(reraise=False)
+            raise
+
+        # Persist everything fetched so far (also after an IP block)
+        writer.close()
+
+        return writer.saved, stopped_early, idx
+
     def add_or_update_channel(self, channel_url: str) -> Dict[str, Any]:
         """
         Add a new channel or update an existing one.
@@ -48,31 +315,29 @@ class ChannelService:
                 'description': channel_info['description'][:100] + '...' if len(channel_info['description']) > 100 else channel_info['description']
             })
 
-            # Check if channel exists
-            existing_channel = self.db.query(Channel).filter(
-                Channel.channel_id == channel_id
-            ).first()
-
-            if existing_channel:
-                self._emit('status', {'message': f'Updating existing channel: {existing_channel.channel_name}'})
-                existing_channel.channel_name = channel_info['channel_name']
-                existing_channel.description = channel_info['description']
-                existing_channel.last_checked = datetime.utcnow()
-                existing_channel.updated_at = datetime.utcnow()
-                db_channel = existing_channel
-            else:
-                self._emit('status', {'message': f'Adding new channel: {channel_info["channel_name"]}'})
-                db_channel = Channel(
-                    channel_id=channel_id,
-                    channel_name=channel_info['channel_name'],
-                    channel_url=channel_url,
-                    description=channel_info['description'],
-                    last_checked=datetime.utcnow()
-                )
-                self.db.add(db_channel)
-
+            # Insert or update the channel in a single statement
+            self._emit('status', {'message': f'Saving channel: {channel_info["channel_name"]}'})
+            now = datetime.utcnow()
+            stmt = pg_insert(Channel).values(
+                channel_id=channel_id,
+                channel_name=channel_info['channel_name'],
+                channel_url=channel_url,
+                description=channel_info['description'],
+                last_checked=now
+            ).on_conflict_do_update(
+                index_elements=['channel_id'],
+                set_={
+                    'channel_name': channel_info['channel_name'],
+                    'description': channel_info['description'],
+                    'last_checked': now,
+                    'updated_at': now
+                }
+            ).returning(Channel)
+
+            db_channel = self.db.scalars(
+                stmt, execution_options={'populate_existing': True}
+            ).one()
             self.db.commit()
-            self.db.refresh(db_channel)
 
             # Fetch all videos
             self._emit('status', {'message': 'Fetching all videos from channel...'})
@@ -95,20 +360,29 @@ class ChannelService:
         new_videos = 0
         updated_videos = 0
 
+        # Look up every existing video in one query instead of one per video
+        existing_videos = {
+            v.video_id: v for v in self.db.query(Video).filter(
+                Video.video_id.in_([v['video_id'] for v in videos])
+            )
+        }
+
+        # Throttle video_progress to ~100 events per run
+        emit = self._emit
+        total = len(videos)
+        progress_step = max(1, total // 100)
         for idx, video_data in enumerate(videos, 1):
             video_id = video_data['video_id']
 
-            self._emit('video_progress', {
-                'current': idx,
-                'total': len(videos),
-                'video_id': video_id,
-                'title': video_data['title']
-            })
+            if idx == 1 or idx % progress_step == 0 or idx == total:
+                emit('video_progress', {
+                    'current': idx,
+                    'total': total,
+                    'video_id': video_id,
+                    'title': video_data['title']
+                })
 
-            # Check if video exists
-            existing_video = self.db.query(Video).filter(
-                Video.video_id == video_id
-            ).first()
+            existing_video = existing_videos.get(video_id)
 
             if existing_video:
                 # Update existing video metadata
@@ -116,7 +390,7 @@ class ChannelService:
                 existing_video.description = video_data['description']
                 existing_video.thumbnail_url = video_data['thumbnail_url']
                 updated_videos += 1
-                self._emit('video_status', {'status': 'updated'})
+                emit('video_status', {'status': 'updated'})
             else:
                 # Create new video
                 db_video = Video(
@@ -124,12 +398,13 @@ class ChannelService:
                     video_id=video_id,
                     title=video_data['title'],
                     description=video_data['description'],
-                    published_at=datetime.fromisoformat(video_data['published_at'].replace('Z', '+00:00')),
+                    published_at=parse_published_at(video_data['published_at']),
                     thumbnail_url=video_data['thumbnail_url']
                 )
                 self.db.add(db_video)
+                existing_videos[video_id] = db_video
                 new_videos += 1
-                self._emit('video_status', {'status': 'added'})
+                emit('video_status', {'status': 'added'})
 
         self.db.commit()
 
@@ -150,111 +425,6 @@ class ChannelService:
 
         return summary
 
-    def _process_videos(self, channel: Channel, videos: list) -> Dict[str, Any]:
-        """Process videos and fetch transcripts"""
-        new_videos = 0
-        updated_videos = 0
-        new_transcripts = 0
-        stopped_early = False
-
-        for idx, video_data in enumerate(videos, 1):
-            video_id = video_data['video_id']
-
-            self._emit('video_progress', {
-                'current': idx,
-                'total': len(videos),
-                'video_id': video_id,
-                'title': video_data['title']
-            })
-
-            # Check if video exists
-            existing_video = self.db.query(Video).filter(
-                Video.video_id == video_id
-            ).first()
-
-            if existing_video:
-                updated_videos += 1
-                db_video = existing_video
-            else:
-                db_video = Video(
-                    channel_id=channel.id,
-                    video_id=video_id,
-                    title=video_data['title'],
-                    description=video_data['description'],
-                    published_at=datetime.fromisoformat(video_data['published_at'].replace('Z', '+00:00')),
-                    thumbnail_url=video_data['thumbnail_url']
-                )
-                self.db.add(db_video)
-                self.db.commit()
-                self.db.refresh(db_video)
-                new_videos += 1
-
-            # Check if transcript exists
-            existing_transcript = self.db.query(Transcript).filter(
-                Transcript.video_id == db_video.id
-            ).first()
-
-            if existing_transcript:
-                self._emit('video_status', {'status': 'has_transcript'})
-                continue
-
-            # Fetch transcript
-            self._emit('video_status', {'status': 'fetching_transcript'})
-
-            try:
-                transcript_data, error_data = self.transcript_fetcher.fetch_transcript(video_id)
-            except IpBlockedException as e:
-                self._emit('error', {
-                    'message': f'IP blocked after processing {idx} videos. Stopping transcript fetching.'
-                })
-                stopped_early = True
-                break
-
-            if transcript_data:
-                db_transcript = Transcript(
-                    video_id=db_video.id,
-                    text=transcript_data['text'],
-                    snippets=transcript_data['snippets'],
-                    language_code=transcript_data['language_code'],
-                    is_generated=transcript_data['is_generated']
-                )
-                self.db.add(db_transcript)
-                self.db.commit()
-                new_transcripts += 1
-                self._emit('video_status', {
-                    'status': 'transcript_saved',
-                    'length': len(transcript_data['text'])
-                })
-            elif error_data:
-                db_error = TranscriptError(
-                    video_id=db_video.id,
-                    error_type=error_data['error_type'],
-                    error_message=error_data['error_message']
-                )
-                self.db.add(db_error)
-                self.db.commit()
-                self._emit('video_status', {
-                    'status': 'error',
-                    'error_type': error_data['error_type']
-                })
-
-        # Update channel last_checked
-        channel.last_checked = datetime.utcnow()
-        self.db.commit()
-
-        summary = {
-            'channel_name': channel.channel_name,
-            'total_videos': len(videos),
-            'new_videos': new_videos,
-            'updated_videos': updated_videos,
-            'new_transcripts': new_transcripts,
-            'stopped_early': stopped_early
-        }
-
-        self._emit('complete', summary)
-
-        return summary
-
     def check_for_new_videos(self, channel_id: str) -> Dict[str, Any]:
         """Check for new videos in an existing channel - adds metadata only, no transcripts"""
         channel = self.db.query(Channel).filter(
@@ -268,9 +438,9 @@ class ChannelService:
 
         # Get existing video IDs
         existing_video_ids = set(
-            v.video_id for v in self.db.query(Video).filter(
+            r[0] for r in self.db.query(Video.video_id).filter(
                 Video.channel_id == channel.id
-            ).all()
+            )
         )
 
         # Fetch all videos from YouTube
@@ -293,26 +463,32 @@ class ChannelService:
 
         # Add video metadata ONLY - don't fetch transcripts
         new_video_count = 0
+
+        # Throttle video_progress to ~100 events per run
+        emit = self._emit
+        total = len(new_videos)
+        progress_step = max(1, total // 100)
         for idx, video_data in enumerate(new_videos, 1):
-            self._emit('video_progress', {
-                'current': idx,
-                'total': len(new_videos),
-                'video_id': video_data['video_id'],
-                'title': video_data['title']
-            })
+            if idx == 1 or idx % progress_step == 0 or idx == total:
+                emit('video_progress', {
+                    'current': idx,
+                    'total': total,
+                    'video_id': video_data['video_id'],
+                    'title': video_data['title']
+                })
 
             db_video = Video(
                 channel_id=channel.id,
                 video_id=video_data['video_id'],
                 title=video_data['title'],
                 description=video_data['description'],
-                published_at=datetime.fromisoformat(video_data['published_at'].replace('Z', '+00:00')),
+                published_at=parse_published_at(video_data['published_at']),
                 thumbnail_url=video_data['thumbnail_url']
             )
             self.db.add(db_video)
             new_video_count += 1
 
-            self._emit('video_status', {'status': 'video_added'})
+            emit('video_status', {'status': 'video_added'})
 
         self.db.commit()
 
@@ -334,7 +510,8 @@ class ChannelService:
 
         return summary
 
-    def retry_failed_transcripts(self, channel_id: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    def retry_failed_transcripts(self, channel_id: str, limit: Optional[int] = None,
+                                 concurrency: int = FETCH_WORKERS) -> Dict[str, Any]:
         """Retry fetching transcripts for videos that failed"""
         channel = self.db.query(Channel).filter(
             Channel.channel_id == channel_id
@@ -348,78 +525,28 @@ class ChannelService:
         # Get videos without transcripts but with retryable errors
         RETRYABLE_ERRORS = {'RequestBlocked', 'IpBlocked', 'YouTubeRequestFailed'}
 
-        videos_with_errors = self.db.query(TranscriptError.video_id).filter(
-            TranscriptError.error_type.in_(RETRYABLE_ERRORS)
-        ).distinct().subquery()
-
-        query = self.db.query(Video).outerjoin(Transcript).filter(
+        query = self.db.query(Video.id, Video.video_id, Video.title).join(
+            TranscriptError, TranscriptError.video_id == Video.id
+        ).outerjoin(
+            Transcript, Transcript.video_id == Video.id
+        ).filter(
             Video.channel_id == channel.id,
             Transcript.id == None,
-            Video.id.in_(videos_with_errors)
-        )
+            TranscriptError.error_type.in_(RETRYABLE_ERRORS)
+        ).distinct()
 
         # Add limit if specified
         if limit:
             query = query.limit(limit)
 
+        # Plain (id, video_id, title) rows; the total is needed up front for progress
         videos_to_retry = query.all()
 
         self._emit('videos_to_retry', {'count': len(videos_to_retry)})
 
-        success_count = 0
-        stopped_early = False
-
-        for idx, video in enumerate(videos_to_retry, 1):
-            self._emit('video_progress', {
-                'current': idx,
-                'total': len(videos_to_retry),
-                'video_id': video.video_id,
-                'title': video.title
-            })
-
-            try:
-                transcript_data, error_data = self.transcript_fetcher.fetch_transcript(video.video_id)
-            except IpBlockedException as e:
-                self._emit('error', {
-                    'message': f'IP blocked after processing {idx} videos. Stopping transcript fetching.'
-                })
-                stopped_early = True
-                break
-
-            if transcript_data:
-                db_transcript = Transcript(
-                    video_id=video.id,
-                    text=transcript_data['text'],
-                    snippets=transcript_data['snippets'],
-                    language_code=transcript_data['language_code'],
-                    is_generated=transcript_data['is_generated']
-                )
-                self.db.add(db_transcript)
-
-                # Delete previous errors
-                self.db.query(TranscriptError).filter(
-                    TranscriptError.video_id == video.id
-                ).delete()
-
-                self.db.commit()
-                success_count += 1
-                self._emit('video_status', {
-                    'status': 'transcript_saved',
-                    'length': len(transcript_data['text'])
-                })
-            elif error_data:
-                # Update error
-                db_error = TranscriptError(
-                    video_id=video.id,
-                    error_type=error_data['error_type'],
-                    error_message=error_data['error_message']
-                )
-                self.db.add(db_error)
-                self.db.commit()
-                self._emit('video_status', {
-                    'status': 'error',
-                    'error_type': error_data['error_type']
-                })
+        success_count, stopped_early, idx = self._fetch_and_persist_transcripts(
+            videos_to_retry, clear_errors=True, concurrency=concurrency
+        )
 
         summary = {
             'channel_name': channel.channel_name,
@@ -480,101 +607,44 @@ class ChannelService:
             self.db.commit()
             self.db.refresh(db_channel)
 
-            # Fetch all videos
+            # Stream videos page by page, inserting each page's new metadata
+            # as it arrives instead of holding the whole channel in memory
             self._emit('status', {'message': 'Fetching all videos from channel...'})
-            videos = self.yt_client.get_all_videos(channel_info['uploads_playlist_id'])
-
-            self._emit('videos_found', {'count': len(videos)})
-
-            # Add all video metadata
+            channel_pk = db_channel.id
+            video_pks = {}
+            total_videos = 0
             new_videos = 0
-            for video_data in videos:
-                existing_video = self.db.query(Video).filter(
-                    Video.video_id == video_data['video_id']
-                ).first()
-
-                if not existing_video:
-                    db_video = Video(
-                        channel_id=db_channel.id,
-                        video_id=video_data['video_id'],
-                        title=video_data['title'],
-                        description=video_data['description'],
-                        published_at=datetime.fromisoformat(video_data['published_at'].replace('Z', '+00:00')),
-                        thumbnail_url=video_data['thumbnail_url']
-                    )
-                    self.db.add(db_video)
-                    new_videos += 1
+            videos_to_scrape = []
 
-            self.db.commit()
+            for page in self.yt_client.iter_video_pages(channel_info['uploads_playlist_id']):
+                total_videos += len(page)
+                new_videos += self._insert_new_videos(channel_pk, page, video_pks)
 
-            # Fetch transcripts for first N videos only
-            videos_to_scrape = videos[:transcript_limit]
-            new_transcripts = 0
-            stopped_early = False
+                # Transcripts are only fetched for the first N videos
+                if len(videos_to_scrape) < transcript_limit:
+                    videos_to_scrape.extend(page[:transcript_limit - len(videos_to_scrape)])
 
-            for idx, video_data in enumerate(videos_to_scrape, 1):
-                video_id = video_data['video_id']
+                self._emit('videos_found_so_far', {'count': total_videos})
 
-                self._emit('video_progress', {
-                    'current': idx,
-                    'total': len(videos_to_scrape),
-                    'video_id': video_id,
-                    'title': video_data['title']
-                })
-
-                # Get the video from DB
-                db_video = self.db.query(Video).filter(
-                    Video.video_id == video_id
-                ).first()
+            self._emit('videos_found', {'count': total_videos})
 
-                # Check if transcript exists
-                existing_transcript = self.db.query(Transcript).filter(
-                    Transcript.video_id == db_video.id
-                ).first()
+            # Primary keys come from each page's lookup and the insert's RETURNING
+            videos_with_transcripts = set(
+                r[0] for r in self.db.query(Transcript.video_id).filter(
+                    Transcript.video_id.in_([video_pks[v['video_id']] for v in videos_to_scrape])
+                )
+            )
 
-                if existing_transcript:
+            # Videos that already have a transcript are skipped before fetching
+            videos_to_fetch = []
+            for video_data in videos_to_scrape:
+                video_pk = video_pks[video_data['video_id']]
+                if video_pk in videos_with_transcripts:
                     self._emit('video_status', {'status': 'has_transcript'})
-                    continue
-
-                # Fetch transcript
-                self._emit('video_status', {'status': 'fetching_transcript'})
+                else:
+                    videos_to_fetch.append((video_pk, video_data['video_id'], video_data['title']))
 
-                try:
-                    transcript_data, error_data = self.transcript_fetcher.fetch_transcript(video_id)
-                except IpBlockedException as e:
-                    self._emit('error', {
-                        'message': f'IP blocked after processing {idx} videos. Stopping transcript fetching.'
-                    })
-                    stopped_early = True
-                    break
-
-                if transcript_data:
-                    db_transcript = Transcript(
-                        video_id=db_video.id,
-                        text=transcript_data['text'],
-                        snippets=transcript_data['snippets'],
-                        language_code=transcript_data['language_code'],
-                        is_generated=transcript_data['is_generated']
-                    )
-                    self.db.add(db_transcript)
-                    self.db.commit()
-                    new_transcripts += 1
-                    self._emit('video_status', {
-                        'status': 'transcript_saved',
-                        'length': len(transcript_data['text'])
-                    })
-                elif error_data:
-                    db_error = TranscriptError(
-                        video_id=db_video.id,
-                        error_type=error_data['error_type'],
-                        error_message=error_data['error_message']
-                    )
-                    self.db.add(db_error)
-                    self.db.commit()
-                    self._emit('video_status', {
-                        'status': 'error',
-                        'error_type': error_data['error_type']
-                    })
+            new_transcripts, stopped_early, idx = self._fetch_and_persist_transcripts(videos_to_fetch)
 
             # Update channel last_checked
             db_channel.last_checked = datetime.utcnow()
@@ -586,7 +656,7 @@ class ChannelService:
             summary = {
                 'channel_id': channel_id,
                 'channel_name': channel_info['channel_name'],
-                'total_videos': len(videos),
+                'total_videos': total_videos,
                 'new_videos': new_videos,
                 'new_transcripts': new_transcripts,
                 'transcripts_scraped': len(videos_to_scrape) if not stopped_early else idx,
@@ -601,7 +671,8 @@ class ChannelService:
             self._emit('error', {'message': str(e)})
             raise
 
-    def fetch_missing_transcripts(self, channel_id: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    def fetch_missing_transcripts(self, channel_id: str, limit: Optional[int] = None,
+                                  concurrency: int = FETCH_WORKERS) -> Dict[str, Any]:
         """Fetch transcripts for videos that don't have them yet (never attempted)"""
         channel = self.db.query(Channel).filter(
             Channel.channel_id == channel_id
@@ -613,17 +684,23 @@ class ChannelService:
         self._emit('status', {'message': f'Fetching missing transcripts: {channel.channel_name}'})
 
         # Get videos without transcripts AND without errors (never attempted)
-        videos_with_errors = self.db.query(TranscriptError.video_id).distinct()
-
-        videos_without_transcripts = self.db.query(Video).outerjoin(Transcript).filter(
+        # Anti-join on both tables so the planner can use the video_id indexes
+        videos_without_transcripts = self.db.query(
+            Video.id, Video.video_id, Video.title
+        ).outerjoin(
+            Transcript, Transcript.video_id == Video.id
+        ).outerjoin(
+            TranscriptError, TranscriptError.video_id == Video.id
+        ).filter(
             Video.channel_id == channel.id,
             Transcript.id == None,
-            ~Video.id.in_(videos_with_errors)
+            TranscriptError.id == None
         ).order_by(Video.published_at.desc())
 
         if limit:
             videos_without_transcripts = videos_without_transcripts.limit(limit)
 
+        # Plain (id, video_id, title) rows; the total is needed up front for progress
         videos_to_fetch = videos_without_transcripts.all()
 
         self._emit('videos_to_retry', {'count': len(videos_to_fetch)})
@@ -637,53 +714,9 @@ class ChannelService:
             self._emit('complete', summary)
             return summary
 
-        success_count = 0
-        stopped_early = False
-
-        for idx, video in enumerate(videos_to_fetch, 1):
-            self._emit('video_progress', {
-                'current': idx,
-                'total': len(videos_to_fetch),
-                'video_id': video.video_id,
-                'title': video.title
-            })
-
-            try:
-                transcript_data, error_data = self.transcript_fetcher.fetch_transcript(video.video_id)
-            except IpBlockedException as e:
-                self._emit('error', {
-                    'message': f'IP blocked after processing {idx} videos. Stopping transcript fetching.'
-                })
-                stopped_early = True
-                break
-
-            if transcript_data:
-                db_transcript = Transcript(
-                    video_id=video.id,
-                    text=transcript_data['text'],
-                    snippets=transcript_data['snippets'],
-                    language_code=transcript_data['language_code'],
-                    is_generated=transcript_data['is_generated']
-                )
-                self.db.add(db_transcript)
-                self.db.commit()
-                success_count += 1
-                self._emit('video_status', {
-                    'status': 'transcript_saved',
-                    'length': len(transcript_data['text'])
-                })
-            elif error_data:
-                db_error = TranscriptError(
-                    video_id=video.id,
-                    error_type=error_data['error_type'],
-                    error_message=error_data['error_message']
-                )
-                self.db.add(db_error)
-                self.db.commit()
-                self._emit('video_status', {
-                    'status': 'error',
-                    'error_type': error_data['error_type']
-                })
+        success_count, stopped_early, idx = self._fetch_and_persist_transcripts(
+            videos_to_fetch, concurrency=concurrency
+        )
 
         summary = {
             'channel_name': channel.channel_name,
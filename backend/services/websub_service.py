@@ -1,21 +1,343 @@
 import hmac
-import hashlib
 import secrets
+import queue
+import threading
 import requests
 import feedparser
-from datetime import datetime, timedelta, timezone
-from sqlalchemy.orm import Session
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
+from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from sqlalchemy import and_, case, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload
+from typing import Optional, Dict, Any, List
 from backend.models import Channel, WebSubSubscription, Video
-from backend.config import WEBSUB_CALLBACK_URL, WEBSUB_SECRET
+from backend.config import WEBSUB_CALLBACK_URL, WEBSUB_SECRET, WEBSUB_SECRET_BYTES
+from backend.youtube_client import YouTubeClient, VIDEO_IDS_PER_REQUEST, parse_published_at
 import logging
 
+try:
+    from lxml import etree
+except ImportError:  # feedparser handles every payload without lxml
+    etree = None
+
 logger = logging.getLogger(__name__)
 
 WEBSUB_HUB_URL = "https://pubsubhubbub.appspot.com/subscribe"
 YOUTUBE_FEED_TEMPLATE = "https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}"
 
 
+def _build_hub_session() -> requests.Session:
+    """Session with pooled keep-alive connections to the hub, shared by all requests"""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'youtube-transcript-search-websub/1.0'
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504], allowed_methods=None)
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+_HUB_SESSION = _build_hub_session()
+
+# Concurrent hub requests when renewing subscriptions
+RENEW_WORKERS = 8
+
+# Subscriptions claimed per renewal batch; rows are only locked until the
+# claim (new tokens, status 'pending') is committed
+RENEW_BATCH_SIZE = 100
+
+# Seconds after which a renewal claim that never got verified (e.g. the run
+# died between the claim commit and the hub requests) may be claimed again
+RENEW_CLAIM_TIMEOUT = 3600
+
+# Requested subscription lease (5 days)
+LEASE_SECONDS = '432000'
+
+# Channel primary keys kept in memory; channels are read-mostly after onboarding
+CHANNEL_PK_CACHE_SIZE = 4096
+CHANNEL_PK_CACHE_TTL = 300
+
+_channel_pk_cache = TTLCache(maxsize=CHANNEL_PK_CACHE_SIZE, ttl=CHANNEL_PK_CACHE_TTL)
+_channel_pk_lock = threading.Lock()
+
+
+def _channel_pk_for(db: Session, channel_id: str) -> Optional[int]:
+    """
+    Look up a channel's primary key, caching hits for CHANNEL_PK_CACHE_TTL seconds.
+    Misses aren't cached so a channel added later is found straight away.
+    """
+    with _channel_pk_lock:
+        pk = _channel_pk_cache.get(channel_id)
+    if pk is not None:
+        return pk
+
+    pk = db.query(Channel.id).filter(Channel.channel_id == channel_id).scalar()
+    if pk is not None:
+        with _channel_pk_lock:
+            _channel_pk_cache[channel_id] = pk
+    return pk
+
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+YT_NS = '{http://www.youtube.com/xml/schemas/2015}'
+
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True) if etree is not None else None
+
+
+def _parse_notification(payload: bytes) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Extract the fields we use from a notification's first Atom entry.
+    Uses lxml when available and falls back to feedparser for payloads
+    lxml can't parse. Returns None if the feed has no entries.
+    """
+    if etree is not None:
+        try:
+            root = etree.fromstring(payload, _XML_PARSER)
+        except etree.XMLSyntaxError:
+            root = None
+
+        if root is not None:
+            entry = root.find(f'{ATOM_NS}entry')
+            if entry is None:
+                return None
+            return {
+                'video_id': entry.findtext(f'{YT_NS}videoId'),
+                'channel_id': entry.findtext(f'{YT_NS}channelId'),
+                'title': entry.findtext(f'{ATOM_NS}title'),
+                'published': entry.findtext(f'{ATOM_NS}published')
+            }
+
+    feed = feedparser.parse(payload)
+    if not feed.entries:
+        return None
+    entry = feed.entries[0]
+    return {
+        'video_id': entry.get('yt_videoid'),
+        'channel_id': entry.get('yt_channelid'),
+        'title': entry.get('title'),
+        'published': entry.get('published')
+    }
+
+
+_yt_clients = threading.local()
+
+
+def _get_yt_client() -> YouTubeClient:
+    """
+    Return this thread's YouTubeClient, building it on first use.
+    One per thread rather than per process because the underlying
+    httplib2 transport is not thread-safe.
+    """
+    client = getattr(_yt_clients, 'client', None)
+    if client is None:
+        client = _yt_clients.client = YouTubeClient()
+    return client
+
+
+# Longest a notification waits for its video details lookup
+VIDEO_DETAILS_TIMEOUT = 15
+
+
+class _VideoDetailsBatcher:
+    """
+    Coalesce video detail lookups from concurrent notifications into
+    videos().list calls of up to VIDEO_IDS_PER_REQUEST ids, made from one
+    background thread. An isolated lookup is sent as soon as it arrives.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='video-details', daemon=True)
+        self._thread.start()
+
+    def lookup(self, video_id: str) -> 'Future[Optional[Dict]]':
+        """Queue a lookup; the future resolves to the details, or None if YouTube has none"""
+        future = Future()
+        self._queue.put((video_id, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < VIDEO_IDS_PER_REQUEST:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                details = _get_yt_client().get_video_details_batch(
+                    list(dict.fromkeys(video_id for video_id, _ in batch))
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch details for {len(batch)} video(s): {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for video_id, future in batch:
+                future.set_result(details.get(video_id))
+
+
+_video_details_batcher: Optional[_VideoDetailsBatcher] = None
+_video_details_batcher_lock = threading.Lock()
+
+
+def _get_video_details_batcher() -> _VideoDetailsBatcher:
+    """Return the process-wide video details batcher"""
+    global _video_details_batcher
+    with _video_details_batcher_lock:
+        if _video_details_batcher is None:
+            _video_details_batcher = _VideoDetailsBatcher()
+        return _video_details_batcher
+
+
+def _post_subscribe(topic_url: str, verify_token: str, secret: str) -> None:
+    """Send a subscribe request to the hub. Raises requests.RequestException on failure."""
+    data = {
+        'hub.mode': 'subscribe',
+        'hub.topic': topic_url,
+        'hub.callback': WEBSUB_CALLBACK_URL,
+        'hub.verify': 'async',
+        'hub.verify_token': verify_token,
+        'hub.secret': secret,
+        'hub.lease_seconds': LEASE_SECONDS
+    }
+    response = _HUB_SESSION.post(WEBSUB_HUB_URL, data=data, timeout=10)
+    response.raise_for_status()
+
+
+# Longest a notification waits for its video insert to be committed
+NOTIFICATION_WRITE_TIMEOUT = 10
+
+
+class _NotificationWriter:
+    """
+    Group-commit notification writes from a background thread with its own
+    Session. Whatever queues up while a flush is running is written by the
+    next one: a single multi-row INSERT ... ON CONFLICT DO NOTHING, a single
+    last_notification_at UPDATE (per channel, via CASE) and one commit. An
+    isolated notification is flushed as soon as it arrives.
+    """
+
+    def __init__(self, bind):
+        self._queue = queue.Queue()
+        self._bind = bind
+        self._thread = threading.Thread(target=self._run, name='notification-writer', daemon=True)
+        self._thread.start()
+
+    def touch(self, channel_pk: int, now: datetime):
+        """Record a notification for a channel without waiting for the write"""
+        self._queue.put((channel_pk, now, None, None))
+
+    def insert(self, channel_pk: int, now: datetime, row: Dict[str, Any]) -> 'Future[bool]':
+        """Queue a video row; the future resolves to False if the video already existed"""
+        future = Future()
+        self._queue.put((channel_pk, now, row, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._flush(batch)
+            except Exception as e:
+                # Keep the thread alive; fail whatever the flush left unresolved
+                logger.error(f"Notification writer failed on {len(batch)} notification(s): {e}")
+                for _, _, _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+
+    def _flush(self, batch: List[tuple]):
+        """
+        Write a batch in one transaction. If the batch fails, its savepoint is
+        rolled back and the notifications are retried under one savepoint
+        each, so a bad one fails alone without losing the rest of the batch.
+        """
+        db = Session(bind=self._bind)
+        try:
+            inserted = set()
+            try:
+                with db.begin_nested():
+                    inserted = self._write(db, batch)
+            except Exception:
+                for item in batch:
+                    try:
+                        with db.begin_nested():
+                            inserted |= self._write(db, [item])
+                    except Exception as e:
+                        logger.error(f"Failed to write notification for channel {item[0]}: {e}")
+                        if item[3] is not None:
+                            item[3].set_exception(e)
+
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to write {len(batch)} notification(s): {e}")
+            for _, _, _, future in batch:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            db.close()
+
+        # Duplicate deliveries within one batch: only the first reports the insert
+        reported = set()
+        for _, _, row, future in batch:
+            if future is not None and not future.done():
+                video_id = row['video_id']
+                future.set_result(video_id in inserted and video_id not in reported)
+                reported.add(video_id)
+
+    def _write(self, db: Session, batch: List[tuple]) -> set:
+        """Write a batch's notification times and videos; returns the inserted video ids"""
+        # Each channel gets the time of its own latest notification
+        latest = {}
+        for channel_pk, now, _, _ in batch:
+            if channel_pk not in latest or now > latest[channel_pk]:
+                latest[channel_pk] = now
+        db.execute(
+            update(WebSubSubscription)
+            .where(WebSubSubscription.channel_id.in_(latest))
+            .values(last_notification_at=case(latest, value=WebSubSubscription.channel_id))
+        )
+
+        # One row per video, so duplicate deliveries in a batch insert once
+        rows = {}
+        for _, _, row, _ in batch:
+            if row is not None:
+                rows.setdefault(row['video_id'], row)
+        if not rows:
+            return set()
+
+        stmt = pg_insert(Video).values(list(rows.values())).on_conflict_do_nothing(
+            index_elements=['video_id']
+        ).returning(Video.video_id)
+        return set(db.execute(stmt).scalars())
+
+
+_notification_writers: Dict[Any, _NotificationWriter] = {}
+_notification_writers_lock = threading.Lock()
+
+
+def _get_notification_writer(bind) -> _NotificationWriter:
+    """Return the process-wide notification writer for a database"""
+    with _notification_writers_lock:
+        writer = _notification_writers.get(bind)
+        if writer is None:
+            writer = _notification_writers[bind] = _NotificationWriter(bind)
+        return writer
+
+
 class WebSubService:
     def __init__(self, db: Session):
         self.db = db
@@ -30,18 +352,18 @@ class WebSubService:
         Returns:
             Dictionary with subscription status
         """
+        now = datetime.utcnow()
+
         try:
             # Get channel from database
-            channel = self.db.query(Channel).filter(
-                Channel.channel_id == channel_id
-            ).first()
+            channel_pk = _channel_pk_for(self.db, channel_id)
 
-            if not channel:
+            if channel_pk is None:
                 raise ValueError(f"Channel {channel_id} not found in database")
 
             # Check if already subscribed
             existing_sub = self.db.query(WebSubSubscription).filter(
-                WebSubSubscription.channel_id == channel.id
+                WebSubSubscription.channel_id == channel_pk
             ).first()
 
             if existing_sub and existing_sub.status == 'active':
@@ -56,21 +378,9 @@ class WebSubService:
             secret = WEBSUB_SECRET
             topic_url = YOUTUBE_FEED_TEMPLATE.format(channel_id=channel_id)
 
-            # Prepare subscription request
-            data = {
-                'hub.mode': 'subscribe',
-                'hub.topic': topic_url,
-                'hub.callback': WEBSUB_CALLBACK_URL,
-                'hub.verify': 'async',
-                'hub.verify_token': verify_token,
-                'hub.secret': secret,
-                'hub.lease_seconds': '432000'  # 5 days
-            }
-
             # Send subscription request to hub
             logger.info(f"Subscribing to channel {channel_id} at hub")
-            response = requests.post(WEBSUB_HUB_URL, data=data, timeout=10)
-            response.raise_for_status()
+            _post_subscribe(topic_url, verify_token, secret)
 
             # Create or update subscription record
             if existing_sub:
@@ -80,17 +390,17 @@ class WebSubService:
                 existing_sub.callback_url = WEBSUB_CALLBACK_URL
                 existing_sub.status = 'pending'
                 existing_sub.last_error = None
-                existing_sub.updated_at = datetime.utcnow()
+                existing_sub.updated_at = now
                 subscription = existing_sub
             else:
                 subscription = WebSubSubscription(
-                    channel_id=channel.id,
+                    channel_id=channel_pk,
                     topic_url=topic_url,
                     callback_url=WEBSUB_CALLBACK_URL,
                     verify_token=verify_token,
                     secret=secret,
                     status='pending',
-                    created_at=datetime.utcnow()
+                    created_at=now
                 )
                 self.db.add(subscription)
 
@@ -125,16 +435,14 @@ class WebSubService:
         """
         try:
             # Get channel from database
-            channel = self.db.query(Channel).filter(
-                Channel.channel_id == channel_id
-            ).first()
+            channel_pk = _channel_pk_for(self.db, channel_id)
 
-            if not channel:
+            if channel_pk is None:
                 raise ValueError(f"Channel {channel_id} not found in database")
 
             # Get subscription
             subscription = self.db.query(WebSubSubscription).filter(
-                WebSubSubscription.channel_id == channel.id
+                WebSubSubscription.channel_id == channel_pk
             ).first()
 
             if not subscription:
@@ -154,7 +462,7 @@ class WebSubService:
 
             # Send unsubscription request to hub
             logger.info(f"Unsubscribing from channel {channel_id}")
-            response = requests.post(WEBSUB_HUB_URL, data=data, timeout=10)
+            response = _HUB_SESSION.post(WEBSUB_HUB_URL, data=data, timeout=10)
             response.raise_for_status()
 
             # Delete subscription record
@@ -187,9 +495,13 @@ class WebSubService:
         Returns:
             Tuple of (success: bool, challenge: str or None)
         """
+        now = datetime.utcnow()
+
         try:
             # Find subscription by topic and verify_token
-            subscription = self.db.query(WebSubSubscription).filter(
+            subscription = self.db.query(WebSubSubscription).options(
+                joinedload(WebSubSubscription.channel)
+            ).filter(
                 WebSubSubscription.topic_url == topic,
                 WebSubSubscription.verify_token == verify_token
             ).first()
@@ -201,11 +513,11 @@ class WebSubService:
             if mode == 'subscribe':
                 # Update subscription as active
                 subscription.status = 'active'
-                subscription.subscribed_at = datetime.utcnow()
+                subscription.subscribed_at = now
                 subscription.lease_seconds = lease_seconds
                 if lease_seconds:
-                    subscription.expires_at = datetime.utcnow() + timedelta(seconds=lease_seconds)
-                subscription.updated_at = datetime.utcnow()
+                    subscription.expires_at = now + timedelta(seconds=lease_seconds)
+                subscription.updated_at = now
                 self.db.commit()
 
                 logger.info(f"Subscription verified and activated for channel {subscription.channel.channel_id}")
@@ -220,14 +532,14 @@ class WebSubService:
             logger.error(f"Error during verification: {e}")
             return False, None
 
-    def verify_signature(self, payload: bytes, signature: str, secret: str) -> bool:
+    def verify_signature(self, payload: bytes, signature: str, secret: bytes = WEBSUB_SECRET_BYTES) -> bool:
         """
         Verify HMAC signature from WebSub hub.
 
         Args:
             payload: Raw request body
             signature: Signature from X-Hub-Signature header
-            secret: Shared secret
+            secret: Shared secret as bytes (defaults to WEBSUB_SECRET_BYTES)
 
         Returns:
             True if signature is valid
@@ -239,20 +551,12 @@ class WebSubService:
             # Signature format: sha1=<hex_digest> or sha256=<hex_digest>
             algorithm, expected_signature = signature.split('=', 1)
 
-            if algorithm == 'sha1':
-                hash_func = hashlib.sha1
-            elif algorithm == 'sha256':
-                hash_func = hashlib.sha256
-            else:
+            if algorithm not in ('sha1', 'sha256'):
                 logger.warning(f"Unknown signature algorithm: {algorithm}")
                 return False
 
-            # Compute HMAC
-            computed_hmac = hmac.new(
-                secret.encode('utf-8'),
-                payload,
-                hash_func
-            ).hexdigest()
+            # One-shot HMAC; a digest name (not a constructor) takes the OpenSSL fast path
+            computed_hmac = hmac.digest(secret, payload, algorithm).hex()
 
             # Compare signatures
             return hmac.compare_digest(computed_hmac, expected_signature)
@@ -272,20 +576,19 @@ class WebSubService:
       Returns:
           Dictionary with processing results
       """
+      now = datetime.utcnow()
+
       try:
-          # Parse Atom feed
-          feed = feedparser.parse(payload)
+          # Parse Atom feed (should be only one entry)
+          entry = _parse_notification(payload)
 
-          if not feed.entries:
+          if entry is None:
               logger.warning("Received notification with no entries")
               return {'success': False, 'message': 'No entries in feed'}
 
-          # Get the entry (should be only one)
-          entry = feed.entries[0]
-
           # Extract data from Atom feed
-          video_id = entry.get('yt_videoid')
-          channel_id = entry.get('yt_channelid')
+          video_id = entry['video_id']
+          channel_id = entry['channel_id']
 
           if not video_id or not channel_id:
               logger.warning("Missing video_id or channel_id in notification")
@@ -294,29 +597,22 @@ class WebSubService:
           logger.info(f"Received notification for video {video_id} on channel {channel_id}")
 
           # Get channel from database
-          channel = self.db.query(Channel).filter(
-              Channel.channel_id == channel_id
-          ).first()
+          channel_pk = _channel_pk_for(self.db, channel_id)
 
-          if not channel:
+          if channel_pk is None:
               logger.warning(f"Channel {channel_id} not found in database")
               return {'success': False, 'message': 'Channel not in database'}
 
-          # Update subscription's last notification time
-          subscription = self.db.query(WebSubSubscription).filter(
-              WebSubSubscription.channel_id == channel.id
-          ).first()
-
-          if subscription:
-              subscription.last_notification_at = datetime.utcnow()
-              self.db.commit()
+          writer = _get_notification_writer(self.db.get_bind())
 
           # Check if video already exists
-          existing_video = self.db.query(Video).filter(
+          video_exists = self.db.query(Video.id).filter(
               Video.video_id == video_id
-          ).first()
+          ).scalar() is not None
 
-          if existing_video:
+          if video_exists:
+              # Update subscription's last notification time
+              writer.touch(channel_pk, now)
               logger.info(f"Video {video_id} already exists in database")
               return {
                   'success': True,
@@ -325,21 +621,20 @@ class WebSubService:
                   'action': 'exists'
               }
 
-          # Fetch full video details from YouTube API
-          from backend.youtube_client import YouTubeClient
-          yt_client = YouTubeClient()
-
+          # Fetch full video details from YouTube API, batched with concurrent notifications
           try:
-              video_details = yt_client.get_video_details(video_id)
+              video_details = _get_video_details_batcher().lookup(video_id).result(
+                  timeout=VIDEO_DETAILS_TIMEOUT
+              )
 
               if not video_details:
                   logger.error(f"Could not fetch video details for {video_id}")
                   # Fall back to basic info from notification
                   video_details = {
                       'video_id': video_id,
-                      'title': entry.get('title', 'Untitled'),
+                      'title': entry['title'] or 'Untitled',
                       'description': '',
-                      'published_at': entry.get('published', datetime.utcnow().isoformat()),
+                      'published_at': entry['published'] or now.isoformat(),
                       'thumbnail_url': f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
                   }
           except Exception as e:
@@ -347,9 +642,9 @@ class WebSubService:
               # Fall back to basic info from notification
               video_details = {
                   'video_id': video_id,
-                  'title': entry.get('title', 'Untitled'),
+                  'title': entry['title'] or 'Untitled',
                   'description': '',
-                  'published_at': entry.get('published', datetime.utcnow().isoformat()),
+                  'published_at': entry['published'] or now.isoformat(),
                   'thumbnail_url': f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
               }
 
@@ -357,23 +652,45 @@ class WebSubService:
           published_at = None
           if video_details.get('published_at'):
               try:
-                  published_at = datetime.fromisoformat(video_details['published_at'].replace('Z', '+00:00'))
+                  published_at = parse_published_at(video_details['published_at'])
               except:
-                  published_at = datetime.utcnow()
-
-          # Create new video entry
-          new_video = Video(
-              channel_id=channel.id,
-              video_id=video_id,
-              title=video_details.get('title', 'Untitled'),
-              description=video_details.get('description', ''),
-              published_at=published_at or datetime.utcnow(),
-              thumbnail_url=video_details.get('thumbnail_url', f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"),
-              created_at=datetime.utcnow()
-          )
-
-          self.db.add(new_video)
-          self.db.commit()
+                  published_at = now
+
+          # Insert with the subscription's last notification time, coalesced with
+          # concurrent notifications; a concurrent redelivery that got here first wins
+          title = video_details.get('title', 'Untitled')
+          pending_write = writer.insert(channel_pk, now, {
+              'channel_id': channel_pk,
+              'video_id': video_id,
+              'title': title,
+              'description': video_details.get('description', ''),
+              'published_at': published_at or now,
+              'thumbnail_url': video_details.get('thumbnail_url', f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"),
+              'created_at': now
+          })
+
+          try:
+              inserted = pending_write.result(timeout=NOTIFICATION_WRITE_TIMEOUT)
+          except FutureTimeoutError:
+              # The write is still queued and may yet commit, so this is not a failure
+              logger.warning(
+                  f"Write for video {video_id} not confirmed after {NOTIFICATION_WRITE_TIMEOUT}s; outcome unknown"
+              )
+              return {
+                  'success': True,
+                  'message': 'Video write queued, outcome unknown',
+                  'video_id': video_id,
+                  'action': 'pending'
+              }
+
+          if not inserted:
+              logger.info(f"Video {video_id} already exists in database")
+              return {
+                  'success': True,
+                  'message': 'Video already exists',
+                  'video_id': video_id,
+                  'action': 'exists'
+              }
 
           logger.info(f"Created new video {video_id} for channel {channel_id}")
 
@@ -381,7 +698,7 @@ class WebSubService:
               'success': True,
               'message': 'New video added',
               'video_id': video_id,
-              'title': new_video.title,
+              'title': title,
               'action': 'created'
           }
 
@@ -399,39 +716,94 @@ class WebSubService:
         Returns:
             Dictionary with renewal statistics
         """
-        try:
-            threshold = datetime.utcnow() + timedelta(hours=hours_before_expiry)
-
-            # Find subscriptions expiring soon
-            expiring_subs = self.db.query(WebSubSubscription).filter(
-                WebSubSubscription.status == 'active',
-                WebSubSubscription.expires_at <= threshold
-            ).all()
+        now = datetime.utcnow()
 
-            renewed = 0
-            failed = 0
+        try:
+            threshold = now + timedelta(hours=hours_before_expiry)
+            stale_claim = now - timedelta(seconds=RENEW_CLAIM_TIMEOUT)
 
-            for sub in expiring_subs:
+            def renew(renewal):
+                sub_id, channel_id, topic_url, verify_token = renewal
+                logger.info(f"Renewing subscription for channel {channel_id}")
                 try:
-                    channel = sub.channel
-                    logger.info(f"Renewing subscription for channel {channel.channel_id}")
+                    _post_subscribe(topic_url, verify_token, WEBSUB_SECRET)
+                    return renewal, None
+                except requests.RequestException as e:
+                    logger.error(f"Failed to renew subscription for channel {channel_id}: {e}")
+                    return renewal, str(e)
 
-                    # Resubscribe (which will update the expiry)
-                    self.subscribe_to_channel(channel.channel_id)
-                    renewed += 1
+            total_expiring = 0
+            renewed = 0
 
-                except Exception as e:
-                    logger.error(f"Failed to renew subscription for channel {channel.channel_id}: {e}")
-                    failed += 1
+            # Only the hub requests run in the pool; the DB session stays on this thread
+            with ThreadPoolExecutor(max_workers=RENEW_WORKERS) as executor:
+                while True:
+                    # Claim a batch of expiring subscriptions, with their channels in the
+                    # same query. Rows locked by a concurrent run are skipped, and every
+                    # claimed row is committed as freshly 'pending' below, so the loop
+                    # always advances. Stale pending claims are picked up again.
+                    expiring_subs = self.db.query(WebSubSubscription).options(
+                        joinedload(WebSubSubscription.channel, innerjoin=True)
+                    ).filter(
+                        or_(
+                            WebSubSubscription.status == 'active',
+                            and_(
+                                WebSubSubscription.status == 'pending',
+                                WebSubSubscription.updated_at <= stale_claim
+                            )
+                        ),
+                        WebSubSubscription.expires_at <= threshold
+                    ).with_for_update(
+                        of=WebSubSubscription, skip_locked=True
+                    ).limit(RENEW_BATCH_SIZE).all()
+
+                    if not expiring_subs:
+                        break
+
+                    renewals = [
+                        (sub.id, sub.channel.channel_id, sub.topic_url, secrets.token_urlsafe(32))
+                        for sub in expiring_subs
+                    ]
+
+                    # Store the new tokens and commit before contacting the hub: its
+                    # verification callback can arrive before the POST returns, and
+                    # the commit also releases the row locks before any network call
+                    self.db.bulk_update_mappings(WebSubSubscription, [
+                        {
+                            'id': sub_id,
+                            'verify_token': verify_token,
+                            'secret': WEBSUB_SECRET,
+                            'callback_url': WEBSUB_CALLBACK_URL,
+                            'status': 'pending',
+                            'last_error': None,
+                            'updated_at': now
+                        }
+                        for sub_id, _, _, verify_token in renewals
+                    ])
+                    self.db.commit()
+
+                    results = list(executor.map(renew, renewals))
+
+                    failures = [
+                        {'id': sub_id, 'status': 'failed', 'last_error': error, 'updated_at': now}
+                        for (sub_id, _, _, _), error in results if error is not None
+                    ]
+                    if failures:
+                        self.db.bulk_update_mappings(WebSubSubscription, failures)
+                        self.db.commit()
+
+                    total_expiring += len(results)
+                    renewed += len(results) - len(failures)
 
             return {
                 'success': True,
-                'total_expiring': len(expiring_subs),
+                'total_expiring': total_expiring,
                 'renewed': renewed,
-                'failed': failed
+                'failed': total_expiring - renewed
             }
 
         except Exception as e:
+            self.db.rollback()
             logger.error(f"Error renewing subscriptions: {e}")
             return {'success': False, 'message': str(e)}
 
@@ -445,15 +817,13 @@ class WebSubService:
         Returns:
             Dictionary with subscription info or None
         """
-        channel = self.db.query(Channel).filter(
-            Channel.channel_id == channel_id
-        ).first()
+        channel_pk = _channel_pk_for(self.db, channel_id)
 
-        if not channel:
+        if channel_pk is None:
             return None
 
         subscription = self.db.query(WebSubSubscription).filter(
-            WebSubSubscription.channel_id == channel.id
+            WebSubSubscription.channel_id == channel_pk
         ).first()
 
         if not subscription:
@@ -468,7 +838,9 @@ class WebSubService:
         Returns:
             List of subscription dictionaries
         """
-        subscriptions = self.db.query(WebSubSubscription).all()
+        subscriptions = self.db.query(WebSubSubscription).options(
+            joinedload(WebSubSubscription.channel, innerjoin=True)
+        ).all()
         return [self._subscription_to_dict(sub) for sub in subscriptions]
 
     def _subscription_to_dict(self, subscription: WebSubSubscription) -> Dict[str, Any]:
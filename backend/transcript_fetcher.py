@@ -11,6 +11,28 @@ from youtube_transcript_api._errors import (
 from typing import Optional, Dict, Tuple
 import time
 
+# Errors that end a fetch for this video: exception -> (error_type, log message)
+_ERROR_HANDLERS = {
+    AgeRestricted: ('AgeRestricted', "  ⚠️  Video {video_id} is age-restricted"),
+    TranscriptsDisabled: ('TranscriptsDisabled', "  ⚠️  Transcripts disabled for video {video_id}"),
+    NoTranscriptFound: ('NoTranscriptFound', "  ⚠️  No English transcript found for video {video_id}"),
+    VideoUnavailable: ('VideoUnavailable', "  ⚠️  Video {video_id} is unavailable"),
+}
+
+_IP_BLOCKED = (RequestBlocked, IpBlocked)
+
+
+def _lookup_handler(error: Exception) -> Optional[Tuple[str, str]]:
+    """Find the (error_type, log message) entry for a terminal error, if any"""
+    handler = _ERROR_HANDLERS.get(type(error))
+    if handler is None:
+        # Subclasses of the known errors
+        for error_class, class_handler in _ERROR_HANDLERS.items():
+            if isinstance(error, error_class):
+                return class_handler
+    return handler
+
+
 class IpBlockedException(Exception):
     """Raised when IP is blocked - should stop all transcript fetching"""
     pass
@@ -39,7 +61,7 @@ class TranscriptFetcher:
                 raw_data = transcript.to_raw_data()
 
                 # Combine all text segments into one string for full-text search
-                full_text = ' '.join([segment['text'] for segment in raw_data])
+                full_text = ' '.join(segment['text'] for segment in raw_data)
 
                 return {
                     'text': full_text,
@@ -48,44 +70,31 @@ class TranscriptFetcher:
                     'is_generated': transcript.is_generated
                 }, None
 
-            except (RequestBlocked) as e:
-                # IP is blocked - raise exception to stop all processing
-                print(f"  ❌ Request blocked for video {video_id} - stopping all transcript fetching")
-                raise IpBlockedException(f"IP is blocked: {str(e)}")
-
-            except (IpBlocked) as e:
-                # IP is blocked - raise exception to stop all processing
-                print(f"  ❌ IP blocked for video {video_id} - stopping all transcript fetching")
-                raise IpBlockedException(f"IP is blocked: {str(e)}")
-
-            except (YouTubeRequestFailed) as e:
-                # These might be temporary - retry with backoff
-                if attempt < max_retries - 1:
-                    print(f"  ⏸️  Request blocked/rate limited ({type(e).__name__}). Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    error_type = type(e).__name__
-                    error_message = str(e)
-                    print(f"  ❌ Request failed after {max_retries} retries: {error_type}")
-                    return None, {'error_type': error_type, 'error_message': error_message}
-
-            except AgeRestricted as e:
-                print(f"  ⚠️  Video {video_id} is age-restricted")
-                return None, {'error_type': 'AgeRestricted', 'error_message': str(e)}
-            except TranscriptsDisabled as e:
-                print(f"  ⚠️  Transcripts disabled for video {video_id}")
-                return None, {'error_type': 'TranscriptsDisabled', 'error_message': str(e)}
-            except NoTranscriptFound as e:
-                print(f"  ⚠️  No English transcript found for video {video_id}")
-                return None, {'error_type': 'NoTranscriptFound', 'error_message': str(e)}
-            except VideoUnavailable as e:
-                print(f"  ⚠️  Video {video_id} is unavailable")
-                return None, {'error_type': 'VideoUnavailable', 'error_message': str(e)}
             except Exception as e:
+                if isinstance(e, _IP_BLOCKED):
+                    # IP is blocked - raise exception to stop all processing
+                    reason = 'Request blocked' if isinstance(e, RequestBlocked) else 'IP blocked'
+                    print(f"  ❌ {reason} for video {video_id} - stopping all transcript fetching")
+                    raise IpBlockedException(f"IP is blocked: {str(e)}")
+
                 error_type = type(e).__name__
-                error_message = str(e)
-                print(f"  ⚠️  Unexpected error: {error_type} - {error_message}")
-                return None, {'error_type': error_type, 'error_message': error_message}
+
+                if isinstance(e, YouTubeRequestFailed):
+                    # These might be temporary - retry with backoff
+                    if attempt < max_retries - 1:
+                        print(f"  ⏸️  Request blocked/rate limited ({error_type}). Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}...")
+                        time.sleep(retry_delay)
+                        retry_delay *= 2  # Exponential backoff
+                        continue
+                    print(f"  ❌ Request failed after {max_retries} retries: {error_type}")
+                    return None, {'error_type': error_type, 'error_message': str(e)}
+
+                handler = _lookup_handler(e)
+                if handler is not None:
+                    error_type, message = handler
+                    print(message.format(video_id=video_id))
+                else:
+                    print(f"  ⚠️  Unexpected error: {error_type} - {str(e)}")
+                return None, {'error_type': error_type, 'error_message': str(e)}
 
         return None, None
\ No newline at end of file
@@ -1,24 +1,51 @@
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from backend.config import YOUTUBE_API_KEY
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+from datetime import datetime
 import re
 
+try:
+    # C parser, roughly 10x faster than fromisoformat for RFC 3339 timestamps
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = None
+
+
+def parse_published_at(value: str) -> datetime:
+    """Parse a YouTube publishedAt timestamp (e.g. 2024-01-31T12:00:00Z)"""
+    if _parse_datetime is not None:
+        return _parse_datetime(value)
+    return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+
+# Channel URL formats, tried in order
+_CHANNEL_PATTERNS = [
+    re.compile(r'youtube\.com/channel/([^/?]+)'),
+    re.compile(r'youtube\.com/@([^/?]+)'),
+    re.compile(r'youtube\.com/c/([^/?]+)'),
+    re.compile(r'youtube\.com/user/([^/?]+)'),
+]
+
+# Server-side response masks: only the fields we read are sent back
+_PLAYLIST_ITEM_FIELDS = (
+    'nextPageToken,'
+    'items(contentDetails/videoId,snippet(title,description,publishedAt,thumbnails/high/url))'
+)
+_VIDEO_FIELDS = 'items(id,snippet(title,description,publishedAt,thumbnails/high/url))'
+
+# Most ids videos().list accepts in one call
+VIDEO_IDS_PER_REQUEST = 50
+
+
 class YouTubeClient:
     def __init__(self):
-        self.youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        self.youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY, cache_discovery=False)
 
     def extract_channel_id(self, url: str) -> Optional[str]:
         """Extract channel ID from various YouTube URL formats"""
-        patterns = [
-            r'youtube\.com/channel/([^/?]+)',
-            r'youtube\.com/@([^/?]+)',
-            r'youtube\.com/c/([^/?]+)',
-            r'youtube\.com/user/([^/?]+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _CHANNEL_PATTERNS:
+            match = pattern.search(url)
             if match:
                 handle_or_id = match.group(1)
                 # If it starts with UC, it's already a channel ID
@@ -84,7 +111,14 @@ class YouTubeClient:
     def get_all_videos(self, uploads_playlist_id: str) -> List[Dict]:
         """Get all videos from a channel's uploads playlist (reverse chronological)"""
         videos = []
+        for page in self.iter_video_pages(uploads_playlist_id):
+            videos.extend(page)
+        return videos
+
+    def iter_video_pages(self, uploads_playlist_id: str) -> Iterator[List[Dict]]:
+        """Yield a channel's uploads one API page (up to 50 videos) at a time"""
         next_page_token = None
+        fetched = 0
 
         try:
             while True:
@@ -92,31 +126,34 @@ class YouTubeClient:
                     part='snippet,contentDetails',
                     playlistId=uploads_playlist_id,
                     maxResults=50,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields=_PLAYLIST_ITEM_FIELDS
                 )
                 response = request.execute()
 
-                for item in response['items']:
-                    video_data = {
+                page = [
+                    {
                         'video_id': item['contentDetails']['videoId'],
                         'title': item['snippet']['title'],
                         'description': item['snippet'].get('description', ''),
                         'published_at': item['snippet']['publishedAt'],
                         'thumbnail_url': item['snippet']['thumbnails']['high']['url']
                     }
-                    videos.append(video_data)
+                    for item in response['items']
+                ]
+
+                fetched += len(page)
+                yield page
 
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
 
-                print(f"Fetched {len(videos)} videos so far...")
+                print(f"Fetched {fetched} videos so far...")
 
         except HttpError as e:
             print(f"Error fetching videos: {e}")
 
-        return videos
-
     def resolve_handle(self, handle: str) -> Optional[str]:
         """Resolve a YouTube handle (@username) to channel ID"""
         try:
@@ -153,26 +190,35 @@ class YouTubeClient:
 
     def get_video_details(self, video_id: str) -> Optional[Dict]:
         """Get detailed information about a specific video"""
-        try:
-            request = self.youtube.videos().list(
-                part='snippet',
-                id=video_id
-            )
-            response = request.execute()
-
-            if not response['items']:
-                return None
-
-            video = response['items'][0]
-            snippet = video['snippet']
-
-            return {
-                'video_id': video_id,
-                'title': snippet['title'],
-                'description': snippet.get('description', ''),
-                'published_at': snippet['publishedAt'],
-                'thumbnail_url': snippet['thumbnails']['high']['url']
-            }
-        except HttpError as e:
-            print(f"Error fetching video details: {e}")
-            return None
\ No newline at end of file
+        return self.get_video_details_batch([video_id]).get(video_id)
+
+    def get_video_details_batch(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get details for many videos, VIDEO_IDS_PER_REQUEST ids per API call.
+        Returns a video_id -> details mapping; missing or failed ids are absent.
+        """
+        details = {}
+        for start in range(0, len(video_ids), VIDEO_IDS_PER_REQUEST):
+            chunk = video_ids[start:start + VIDEO_IDS_PER_REQUEST]
+            try:
+                request = self.youtube.videos().list(
+                    part='snippet',
+                    id=','.join(chunk),
+                    fields=_VIDEO_FIELDS
+                )
+                response = request.execute()
+            except HttpError as e:
+                print(f"Error fetching video details: {e}")
+                continue
+
+            for video in response['items']:
+                snippet = video['snippet']
+                details[video['id']] = {
+                    'video_id': video['id'],
+                    'title': snippet['title'],
+                    'description': snippet.get('description', ''),
+                    'published_at': snippet['publishedAt'],
+                    'thumbnail_url': snippet['thumbnails']['high']['url']
+                }
+
+        return details
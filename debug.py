@@ -1,31 +1,39 @@
 #!/usr/bin/env python3
+import re
 from backend.database import SessionLocal
 from backend.models import Video, Transcript, Channel
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 db = SessionLocal()
 
-# Check counts
-video_count = db.query(Video).count()
-transcript_count = db.query(Transcript).count()
-channel_count = db.query(Channel).count()
+# Check counts (one round-trip; transcripts are scanned once for both counts)
+transcript_counts = select(
+    func.count().label('total'),
+    func.count(Transcript.text_search_vector).label('with_vectors')
+).subquery()
+
+channel_count, video_count, transcript_count, transcripts_with_vectors = db.execute(
+    select(
+        select(func.count()).select_from(Channel).scalar_subquery(),
+        select(func.count()).select_from(Video).scalar_subquery(),
+        transcript_counts.c.total,
+        transcript_counts.c.with_vectors
+    )
+).one()
 
 print(f"Channels: {channel_count}")
 print(f"Videos: {video_count}")
 print(f"Transcripts: {transcript_count}")
 
 # Check if search vectors are populated
-transcripts_with_vectors = db.query(Transcript).filter(
-    Transcript.text_search_vector.isnot(None)
-).count()
-
 print(f"Transcripts with search vectors: {transcripts_with_vectors}")
 
 # Sample a transcript to see if "welcome" exists anywhere
 sample = db.query(Transcript).first()
 if sample:
     print(f"\nSample transcript length: {len(sample.text)} characters")
-    print(f"Contains 'welcome': {'welcome' in sample.text.lower()}")
+    # Case-insensitive search without building a lowercased copy of the transcript
+    print(f"Contains 'welcome': {re.search('welcome', sample.text, re.IGNORECASE) is not None}")
     print(f"First 200 chars: {sample.text[:200]}")
 
 db.close()
\ No newline at end of file
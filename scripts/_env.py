@@ -0,0 +1,24 @@
+"""
+Environment loading shared by the local scripts
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+# .env.prod in the project root (parent of scripts/)
+ENV_PATH = Path(__file__).parent.parent / '.env.prod'
+
+
+@lru_cache(maxsize=None)
+def _env() -> Dict[str, str]:
+    """Parse .env.prod once per process"""
+    from dotenv import dotenv_values
+    return {key: value for key, value in dotenv_values(ENV_PATH).items() if value is not None}
+
+
+def load_env():
+    """Export .env.prod into os.environ, leaving variables that are already set alone"""
+    for key, value in _env().items():
+        os.environ.setdefault(key, value)
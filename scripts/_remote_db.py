@@ -0,0 +1,178 @@
+"""
+Shared SSH plumbing for the local scripts that work against the remote database
+"""
+
+import csv
+import io
+import json
+import os
+import shlex
+import tempfile
+import time
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from fabric import Connection
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+# Local end of the SSH tunnel to postgres
+LOCAL_PORT = 5433
+
+# Name of the postgres container on the remote host
+POSTGRES_CONTAINER = 'yt-transcript-db'
+
+# Remote commands are non-interactive: no pty, no stdin forwarding, and a
+# non-zero exit is reported through result.ok instead of an exception
+RUN_OPTIONS = {'hide': True, 'pty': False, 'in_stream': False, 'warn': True}
+
+# Container IPs are cached per SSH host so most runs skip the docker inspect round trip
+IP_CACHE_DIR = Path.home() / '.cache' / 'yt-transcript'
+IP_CACHE_TTL = 600
+
+
+@lru_cache(maxsize=None)
+def get_connection(ssh_host: str, ssh_user: str, ssh_key: Optional[str] = None) -> Connection:
+    """
+    Return one Connection per (host, user, key) for the life of the process,
+    so repeated operations reuse the same SSH transport instead of
+    re-negotiating a session each time.
+    """
+    connect_kwargs = {}
+    if ssh_key:
+        connect_kwargs["key_filename"] = ssh_key
+
+    return Connection(
+        host=ssh_host,
+        user=ssh_user,
+        connect_kwargs=connect_kwargs
+    )
+
+
+def _ip_cache_path(ssh_host: str) -> Path:
+    return IP_CACHE_DIR / f"pg_ip_{ssh_host}.json"
+
+
+def invalidate_postgres_ip(ssh_host: str):
+    """Forget the cached container IP for a host"""
+    try:
+        _ip_cache_path(ssh_host).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def get_postgres_ip(conn: Connection, ssh_host: str, ttl: int = IP_CACHE_TTL) -> str:
+    """Get the IP address of the postgres container, cached for ttl seconds"""
+    cache_path = _ip_cache_path(ssh_host)
+    try:
+        cached = json.loads(cache_path.read_text())
+        if time.time() - cached['ts'] < ttl:
+            return cached['ip']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Let docker print just the IPs instead of shipping the full inspect JSON over SSH
+    result = conn.run(
+        "docker inspect --format '{{range .NetworkSettings.Networks}}{{.IPAddress}} {{end}}' " + POSTGRES_CONTAINER,
+        **RUN_OPTIONS
+    )
+    if not result.ok or not result.stdout.split():
+        raise RuntimeError(f"Could not detect postgres container IP: {result.stderr.strip() or 'no IP address'}")
+
+    # Use the first network's IP
+    ip_address = result.stdout.split()[0]
+
+    # Write atomically so a concurrent run never reads a partial file
+    IP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', dir=IP_CACHE_DIR, delete=False) as f:
+        json.dump({'ip': ip_address, 'ts': time.time()}, f)
+    os.replace(f.name, cache_path)
+
+    return ip_address
+
+
+def run_remote_query(ssh_host: str, ssh_user: str, ssh_key: Optional[str], sql: str) -> List[Dict[str, Optional[str]]]:
+    """
+    Run a read-only query with psql inside the postgres container, in a single
+    SSH exec with no IP detection, tunnel or engine setup. Rows come back as
+    dicts of strings, with empty fields as None.
+    """
+    conn = get_connection(ssh_host, ssh_user, ssh_key)
+    result = conn.run(
+        f"docker exec {POSTGRES_CONTAINER} psql -X --csv -v ON_ERROR_STOP=1"
+        f" -U {shlex.quote(os.getenv('POSTGRES_USER', ''))}"
+        f" -d {shlex.quote(os.getenv('POSTGRES_DB', ''))}"
+        f" -c {shlex.quote(sql)}",
+        **RUN_OPTIONS
+    )
+    if not result.ok:
+        raise RuntimeError(f"Remote query failed: {result.stderr.strip()}")
+
+    return [
+        {key: value or None for key, value in row.items()}
+        for row in csv.DictReader(io.StringIO(result.stdout))
+    ]
+
+
+@contextmanager
+def remote_db_session(ssh_host: str, ssh_user: str, ssh_key: Optional[str] = None,
+                      application_name: str = 'yt-transcript-script') -> Iterator[Session]:
+    """
+    Open an SSH tunnel to the remote postgres container and yield a Session
+    through it. The session, engine and tunnel are torn down in reverse on exit.
+    Credentials are read from POSTGRES_USER/POSTGRES_PASSWORD/POSTGRES_DB.
+    """
+    conn = get_connection(ssh_host, ssh_user, ssh_key)
+    db_url = (
+        f"postgresql://{os.getenv('POSTGRES_USER')}:{os.getenv('POSTGRES_PASSWORD')}"
+        f"@localhost:{LOCAL_PORT}/{os.getenv('POSTGRES_DB')}"
+    )
+
+    with ExitStack() as stack:
+        # Detect postgres container IP; a stale cached IP is re-detected once
+        for attempt in range(2):
+            print(f"🔍 Detecting postgres container IP...")
+            postgres_ip = get_postgres_ip(conn, ssh_host)
+            print(f"✓ Found postgres at {postgres_ip}")
+
+            # Create port forward (SSH tunnel) and database connection through it
+            tunnel = stack.enter_context(ExitStack())
+            tunnel.enter_context(conn.forward_local(LOCAL_PORT, remote_host=postgres_ip, remote_port=5432))
+            engine = create_engine(
+                db_url,
+                # The connectivity check's connection is handed on to the session, and
+                # background writer threads get their own, instead of re-handshaking
+                # over the tunnel per transaction
+                pool_size=4,
+                max_overflow=0,
+                pool_pre_ping=True,
+                pool_recycle=300,
+                connect_args={
+                    'application_name': application_name,
+                    # Keep the tunnelled TCP connection alive through long fetches
+                    'keepalives': 1,
+                    'keepalives_idle': 30
+                }
+            )
+            try:
+                engine.connect().close()
+                break
+            except OperationalError:
+                engine.dispose()
+                tunnel.close()
+                if attempt:
+                    raise
+                print(f"⚠️  Could not reach postgres at {postgres_ip}, re-detecting...")
+                invalidate_postgres_ip(ssh_host)
+
+        stack.callback(engine.dispose)
+        print(f"✓ SSH tunnel established (local port {LOCAL_PORT})")
+
+        db = sessionmaker(bind=engine)()
+        stack.callback(db.close)
+        print(f"✓ Connected to remote database\n")
+
+        yield db